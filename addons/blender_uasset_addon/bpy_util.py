@@ -449,7 +449,7 @@ def construct_mesh(mesh_data, positions, indices, uv_maps):
     face_num = len(indices) // 3
 
     mesh_data.vertices.add(len(positions))
-    mesh_data.vertices.foreach_set('co', positions.flatten())
+    mesh_data.vertices.foreach_set('co', positions.ravel())
 
     mesh_data.loops.add(len(indices))
     mesh_data.loops.foreach_set('vertex_index', indices)
@@ -464,7 +464,7 @@ def construct_mesh(mesh_data, positions, indices, uv_maps):
         name = f'UVMap{i}'
         layer = mesh_data.uv_layers.new(name=name)
         uv_map = uv_map[indices]
-        layer.data.foreach_set('uv', uv_map.flatten())
+        layer.data.foreach_set('uv', uv_map.ravel())
     return mesh_data
 
 
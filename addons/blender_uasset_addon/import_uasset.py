@@ -313,9 +313,9 @@ def generate_mesh(amt, asset, materials, material_names, rescale=1.0,
         mesh_data = section.data
         mesh_data.materials.append(materials[material_id])
 
-        pos = np.array(positions[i], dtype=np.float32) * rescale_factor
+        pos = np.asarray(positions[i], dtype=np.float32) * rescale_factor
         pos = bpy_util.flip_y_for_3d_vectors(pos)
-        indice = np.array(indices[i], dtype=np.uint32)
+        indice = np.asarray(indices[i], dtype=np.uint32)
         uv_maps = np.array([uv[i] for uv in texcoords], dtype=np.float32)
         uv_maps = bpy_util.flip_uv_maps(uv_maps)
         bpy_util.construct_mesh(mesh_data, pos, indice, uv_maps)
@@ -93,13 +93,13 @@ def get_primitives(asset, armature, meshes, rescale=1.0, only_mesh=False):
         - BONE_NAMES (list[string])
         - MATERIALS (list[BlenderMaterial])
         - MATERIAL_IDS (list[int]): (section_count)
-        - POSITIONS (list[ilst[float]]): (vertex_count, 3)
-        - NORMALS (list[float]): (vertex_count, 8)
-        - UV_MAPS (list[[list[float]]): (uv_count, vertex_count, 2)
+        - POSITIONS (numpy.ndarray): (vertex_count, 3)
+        - NORMALS (numpy.ndarray): (vertex_count, 8)
+        - UV_MAPS (numpy.ndarray): (uv_count, vertex_count, 2)
         - INDICES (list[int]): (section_count, face_count*3)
         - VERTEX_GROUPS (list[list[int]]): (section_count, -1)
-        - JOINTS (list[list[int]]): (vertex_count, max_influence_count)
-        - WEIGHTS (list[list[int]]): (vertex_count, max_influence_count)
+        - JOINTS (numpy.ndarray): (vertex_count, max_influence_count)
+        - WEIGHTS (numpy.ndarray): (vertex_count, max_influence_count)
         - VERTEX_COUNTS (list[int]): (section_count)
     """
     print('Extracting mesh data from selected objects...')
@@ -220,8 +220,9 @@ def get_primitives(asset, armature, meshes, rescale=1.0, only_mesh=False):
             raise RuntimeError('Failed to calculate tangents. Meshes should be triangulated.')
 
     primitives['VERTEX_COUNTS'] = [len(p) for p in primitives['POSITIONS']]
-    for axis, key in zip([0, 0, 1], ['POSITIONS', 'NORMALS', 'UV_MAPS']):
-        primitives[key] = np.concatenate(primitives[key], axis=axis).tolist()
+    for key in ['POSITIONS', 'NORMALS']:
+        primitives[key] = np.concatenate(primitives[key], axis=0)
+    primitives['UV_MAPS'] = np.concatenate(primitives['UV_MAPS'], axis=1).astype(np.float32)
 
     if armature is not None:
         def floor4(i):
@@ -239,10 +240,10 @@ def get_primitives(asset, armature, meshes, rescale=1.0, only_mesh=False):
         influence_count = floor4(max(influence_counts))
         primitives['JOINTS'] = [lists_zero_fill(j, influence_count) for j in primitives['JOINTS']]
         primitives['JOINTS'] = [np.array(j, dtype=np.uint8) for j in primitives['JOINTS']]
-        primitives['JOINTS'] = np.concatenate(primitives['JOINTS'], axis=0).tolist()
+        primitives['JOINTS'] = np.concatenate(primitives['JOINTS'], axis=0)
         primitives['WEIGHTS'] = [lists_zero_fill(w, influence_count) for w in primitives['WEIGHTS']]
         primitives['WEIGHTS'] = [f_to_i(w) for w in primitives['WEIGHTS']]
-        primitives['WEIGHTS'] = np.concatenate(primitives['WEIGHTS'], axis=0).tolist()
+        primitives['WEIGHTS'] = np.concatenate(primitives['WEIGHTS'], axis=0)
     return primitives
 
 
@@ -5,6 +5,7 @@ Notes:
     It'll just get frame count, bone ids, and compressed binary.
 """
 import os
+import struct
 from ..util import io_util as io
 from .acl import CompressedClip
 
@@ -13,13 +14,14 @@ def read_unversioned_header(f):
     """Skip unversioned headers."""
     offset = f.tell()
     unv_head = io.read_uint8_array(f, 2)
+    size = 2
     is_last = unv_head[1] % 2 == 0
     while is_last:
         unv_head = io.read_uint8_array(f, 2)
+        size += 2
         is_last = unv_head[1] % 2 == 0
-        if f.tell() - offset > 100:
+        if size > 100:
             raise RuntimeError('Parse Failed. ')
-    size = f.tell() - offset
     f.seek(offset)
     headers = f.read(size)
     return headers
@@ -28,21 +30,25 @@ def read_unversioned_header(f):
 def seek_skeleton(f, import_id):
     """Read binary data until find skeleton import ids."""
     offset = f.tell()
-    buf = f.read(3)
     size = io.get_size(f)
+    buf = f.read(3)
+    pos = offset + 3  # track the position by ourselves instead of calling f.tell() per byte
     while True:
         while buf != b'\xff' * 3:
             if b'\xff' not in buf:
                 buf = f.read(3)
+                pos += 3
             else:
                 buf = b''.join([buf[1:], f.read(1)])
-            if f.tell() == size:
+                pos += 1
+            if pos >= size:
                 raise RuntimeError('Skeleton id not found. This is an unexpected error.')
         f.seek(-4, 1)
         imp_id = -io.read_int32(f) - 1
         if imp_id == import_id:
             break
         buf = f.read(3)
+        pos += 3
     size = f.tell() - offset
     f.seek(offset)
     return f.read(size)
@@ -89,14 +95,11 @@ class UnkData:
 
     def write(self, f):
         """Write function."""
-        f.write(b'\x00\x02\x01\x05')
-        f.write(self.unk)
+        binary = [b'\x00\x02\x01\x05', self.unk]
         if self.unk2 is not None:
-            io.write_uint32(f, len(self.unk2) // 27)
-            f.write(self.unk2)
-        io.write_uint32(f, self.unk_int)
-        io.write_uint32(f, self.unk_int2)
-        io.write_uint32(f, 4)
+            binary += [struct.pack('<I', len(self.unk2) // 27), self.unk2]
+        binary.append(struct.pack('<III', self.unk_int, self.unk_int2, 4))
+        f.write(b''.join(binary))
 
 
 class AnimSequence:
@@ -161,12 +164,11 @@ class AnimSequence:
             f.seek(25)
         num_frames = io.read_uint32(f)
 
-        def get_skeleton_import(imports):
-            for imp, i in zip(imports, range(len(imports))):
-                if imp.class_name == 'Skeleton':
-                    return imp, i
         # Skip Notifies
-        skeleton_imp, import_id = get_skeleton_import(uasset.imports)
+        skeleton_imports = uasset.imports_by_class.get('Skeleton')
+        if skeleton_imports is None:
+            raise RuntimeError('Skeleton import not found.')
+        skeleton_imp, import_id = skeleton_imports[0]
         unk = seek_skeleton(f, import_id)
         none_id = uasset.name_list.index('None')
         if uasset.version != 'ff7r':
@@ -219,9 +221,7 @@ class AnimSequence:
         io.write_null(f)
         f.write(self.guid)
 
-        io.write_uint16(f, 1)
-        io.write_uint32(f, 1)
-        io.write_uint8_array(f, self.format_bytes)
+        f.write(struct.pack('<HI4B', 1, 1, *self.format_bytes))  # StripFlags, bSerializeCompressedData, formats
         io.write_int32_array(f, self.track_offsets, with_length=True)
         io.write_uint32_array(f, self.scale_offsets, with_length=True)
         io.write_uint32(f, self.scale_offsets_stripsize)
@@ -254,7 +254,8 @@ class AnimSequence:
 
     def get_skeleton_path(self):
         """Get path to skeleton asset."""
-        skeleton_path = [imp.parent_name for imp in self.uasset.imports if imp.class_name == 'Skeleton'][0]
+        skeleton_imp, _ = self.uasset.imports_by_class['Skeleton'][0]
+        skeleton_path = skeleton_imp.parent_name
 
         def get_actual_path(target_asset_path, source_asset_path, source_actual_path):
             source_asset_dir = os.path.dirname(source_asset_path)
@@ -1,11 +1,14 @@
 """Classes for buffers."""
 
+import functools
 import struct
+import numpy as np
 from ..util import io_util as io
 
 
 class Buffer:
     """Base class for buffers."""
+    HEADER = struct.Struct('<II')  # stride, size
 
     def __init__(self, stride, size, buf, offset, name):
         """Constructor."""
@@ -18,8 +21,12 @@ class Buffer:
     @staticmethod
     def read(f, name=''):
         """Read function."""
-        stride = io.read_uint32(f)
-        size = io.read_uint32(f)
+        stride, size = Buffer.HEADER.unpack(f.read(Buffer.HEADER.size))
+        return Buffer.read_data(f, stride, size, name=name)
+
+    @staticmethod
+    def read_data(f, stride, size, name=''):
+        """Read buffer data that follows the header."""
         offset = f.tell()
         buf = f.read(stride * size)
         return Buffer(stride, size, buf, offset, name)
@@ -27,9 +34,7 @@ class Buffer:
     @staticmethod
     def write(f, buffer):
         """Write function."""
-        io.write_uint32(f, buffer.stride)
-        io.write_uint32(f, buffer.size)
-        f.write(buffer.buf)
+        f.writelines([Buffer.HEADER.pack(buffer.stride, buffer.size), buffer.buf])
 
     def print(self, padding=2):
         """Print meta data."""
@@ -43,7 +48,16 @@ class Buffer:
     def dump(file, buffer):
         """Write buffer."""
         with open(file, 'wb') as f:
-            f.write(buffer.buf)
+            f.write(buffer.view())
+
+    def view(self):
+        """Get buffer data as a memoryview.
+
+        Notes:
+            The view shares memory with the buffer data.
+            Slice it instead of self.buf to avoid copying large buffers.
+        """
+        return memoryview(self.buf)
 
     def get_meta(self):
         """Get meta data."""
@@ -51,7 +65,12 @@ class Buffer:
 
 
 class VertexBuffer(Buffer):
-    """Base clas for vertex buffer."""
+    """Base clas for vertex buffer.
+
+    Notes:
+        parse() returns UV maps as a (uv_num, vertex_num, 2) view with the stored type (float16 or float32).
+        Cast them with astype() when you need other types.
+    """
     def __init__(self, stride, size, buf, offset, name):
         """Constructor."""
         self.vertex_num = size
@@ -66,28 +85,26 @@ class VertexBuffer(Buffer):
 
 class PositionVertexBuffer(VertexBuffer):
     """Positions for static mesh and UE5 skeletal mesh."""
+    HEADER = struct.Struct('<IIII')  # stride, vertex_num, and buffer header
+
     @staticmethod
     def read(f, name=''):
         """Read function."""
-        stride = io.read_uint32(f)
-        vertex_num = io.read_uint32(f)
-        buf = Buffer.read(f, name=name)
-        io.check(stride, buf.stride, f)
-        io.check(vertex_num, buf.size, f)
-
+        stride, vertex_num, buf_stride, buf_size = PositionVertexBuffer.HEADER.unpack(
+            f.read(PositionVertexBuffer.HEADER.size))
+        io.check(stride, buf_stride, f)
+        io.check(vertex_num, buf_size, f)
+        buf = Buffer.read_data(f, buf_stride, buf_size, name=name)
         return PositionVertexBuffer(buf.stride, buf.size, buf.buf, buf.offset, name)
 
     @staticmethod
     def write(f, vb):
         """Write function."""
-        io.write_uint32(f, vb.stride)
-        io.write_uint32(f, vb.vertex_num)
-        Buffer.write(f, vb)
+        f.writelines([PositionVertexBuffer.HEADER.pack(vb.stride, vb.vertex_num, vb.stride, vb.size), vb.buf])
 
     def parse(self):
         """Parse buffer."""
-        parsed = struct.unpack('<' + 'f' * 3 * self.size, self.buf)
-        position = [parsed[i * 3: i * 3 + 3] for i in range(self.size)]
+        position = np.frombuffer(self.view(), dtype='<f4', count=self.size * 3).reshape(self.size, 3)
         return position
 
     def import_from_blender(self, position):
@@ -95,8 +112,7 @@ class PositionVertexBuffer(VertexBuffer):
         self.stride = 12
         self.size = len(position)
         self.vertex_num = self.size
-        buf = flatten(position)
-        self.buf = struct.pack('<' + 'f' * 3 * self.size, *buf)
+        self.buf = np.asarray(position, dtype='<f4').tobytes()
 
 
 class NormalVertexBuffer(VertexBuffer):
@@ -115,29 +131,23 @@ class NormalVertexBuffer(VertexBuffer):
 
     def parse(self):
         """Parse buffer."""
-        def unpack(i):
-            mask8bit = 0xff
-            i = i ^ 0x80808080
-            x = i & mask8bit
-            y = (i >> 8) & mask8bit
-            z = (i >> 16) & mask8bit
-            return [x, y, z]
-
-        parsed = struct.unpack('<' + 'I' * 2 * self.size, self.buf)
-        normal = [unpack(parsed[i * 2 + 1]) for i in range(self.size)]
+        parsed = np.frombuffer(self.view(), dtype=np.uint8).reshape(self.size, 8)
+        normal = parsed[:, 4:7] ^ 0x80  # xyz of the 2nd uint32 (signed int8 -> uint8)
         return normal
 
     def import_from_blender(self, normal):
         """Update buffer."""
         self.size = len(normal)
         self.vertex_num = self.size
-        buf = normal
-        buf = flatten(buf)
-        self.buf = struct.pack('<' + 'B' * self.stride * self.size, *buf)
+        self.buf = np.asarray(normal, dtype=np.uint8).tobytes()
 
 
 class UVVertexBuffer(VertexBuffer):
     """UV maps for UE5 skeletal mesh."""
+    # header of vertex data (read by LODs before normal and uv buffers)
+    # 1, uv_num, vertex_num, use_float32UV, use_high_precision_tangent_basis?
+    VERTEX_HEADER = struct.Struct('<HIIII')
+
     def __init__(self, uv_num, use_flaot32UV, stride, size, buf, offset, name):
         """Constructor."""
         self.uv_num = uv_num
@@ -158,15 +168,11 @@ class UVVertexBuffer(VertexBuffer):
 
     def parse(self):
         """Parse buffer."""
-        float_type = 'f' if self.use_float32UV else 'e'
-        parsed = struct.unpack('<' + float_type * 2 * self.size, self.buf)
-        stride = 2 * self.uv_num
+        float_type = '<f4' if self.use_float32UV else '<f2'
         size = self.size // self.uv_num
-        texcoords = []
-        for j in range(self.uv_num):
-            texcoord = [parsed[i * stride + j * 2: i * stride + j * 2 + 2] for i in range(size)]
-            texcoords.append(texcoord)
-        return texcoords
+        parsed = np.frombuffer(self.view(), dtype=float_type, count=size * self.uv_num * 2)
+        parsed = parsed.reshape(size, self.uv_num, 2)
+        return parsed.transpose(1, 0, 2)
 
     def import_from_blender(self, texcoords):
         """Update buffer."""
@@ -174,17 +180,44 @@ class UVVertexBuffer(VertexBuffer):
         size = len(texcoords[0])
         self.size = size * self.uv_num
         self.vertex_num = self.size
-        buf = texcoords[0]
-        if self.uv_num > 1:
-            for texcoord in texcoords[1:]:
-                buf = [b + t for b, t in zip(buf, texcoord)]
-        buf = flatten(buf)
-        float_type = 'f' if self.use_float32UV else 'e'
-        self.buf = struct.pack('<' + float_type * 2 * self.size, *buf)
+        float_type = '<f4' if self.use_float32UV else '<f2'
+        # (uv_num, vertex_num, 2) -> (vertex_num, uv_num, 2)
+        self.buf = np.asarray(texcoords, dtype=float_type).transpose(1, 0, 2).tobytes()
+
+
+@functools.lru_cache(maxsize=None)
+def get_vertex_dtype(uv_num, use_float32, with_position=False):
+    """Get numpy dtype for a vertex of StaticMeshVertexBuffer or SkeletalMeshVertexBuffer."""
+    uv_type = '<f4' if use_float32 else '<f2'
+    fields = [('tangent', 'u1', 4), ('normal', 'u1', 4)]
+    if with_position:
+        fields.append(('position', '<f4', 3))
+    fields.append(('texcoords', uv_type, (uv_num, 2)))
+    return np.dtype(fields)
+
+
+def pack_vertices(normal, texcoords, uv_num, use_float32, position=None):
+    """Pack vertex attributes into a buffer of StaticMeshVertexBuffer or SkeletalMeshVertexBuffer.
+
+    Notes:
+        UV maps will be narrowed to float16 if use_float32 is False.
+    """
+    normal = np.asarray(normal, dtype=np.uint8)  # (vertex_num, 8): tangent and normal
+    dtype = get_vertex_dtype(uv_num, use_float32, with_position=position is not None)
+    vertices = np.empty(len(normal), dtype=dtype)
+    vertices['tangent'] = normal[:, :4]
+    vertices['normal'] = normal[:, 4:]
+    if position is not None:
+        vertices['position'] = position
+    for j, texcoord in enumerate(texcoords):
+        vertices['texcoords'][:, j] = texcoord
+    return vertices.tobytes()
 
 
 class StaticMeshVertexBuffer(VertexBuffer):
     """Normals and UV maps for static mesh."""
+    HEADER = struct.Struct('<HIIIII')  # 1, uv_num, stride, vertex_num, use_float32, 0
+
     def __init__(self, uv_num, use_float32, stride, size, buf, offset, name):
         """Constructor."""
         self.uv_num = uv_num
@@ -194,13 +227,10 @@ class StaticMeshVertexBuffer(VertexBuffer):
     @staticmethod
     def read(f, name=''):
         """Read function."""
-        one = io.read_uint16(f)
+        one, uv_num, stride, vertex_num, use_float32, null = StaticMeshVertexBuffer.HEADER.unpack(
+            f.read(StaticMeshVertexBuffer.HEADER.size))
         io.check(one, 1, f)
-        uv_num = io.read_uint32(f)
-        stride = io.read_uint32(f)
-        vertex_num = io.read_uint32(f)
-        use_float32 = io.read_uint32(f)
-        io.read_null(f)
+        io.check(null, 0, f, 'Not NULL!')
         buf = Buffer.read(f, name=name)
         io.check(stride, buf.stride, f)
         io.check(vertex_num, buf.size, f)
@@ -210,56 +240,38 @@ class StaticMeshVertexBuffer(VertexBuffer):
     @staticmethod
     def write(f, vb):
         """Write function."""
-        io.write_uint16(f, 1)
-        io.write_uint32(f, vb.uv_num)
-        io.write_uint32(f, vb.stride)
-        io.write_uint32(f, vb.vertex_num)
-        io.write_uint32(f, vb.use_float32)
-        io.write_null(f)
+        f.write(StaticMeshVertexBuffer.HEADER.pack(1, vb.uv_num, vb.stride, vb.vertex_num, vb.use_float32, 0))
         Buffer.write(f, vb)
 
+    def get_vertices(self):
+        """Get buffer as a structured array (tangent, normal, texcoords)."""
+        return np.frombuffer(self.view(), dtype=get_vertex_dtype(self.uv_num, self.use_float32))
+
     def parse(self):
         """Parse buffer."""
-        def unpack(i):
-            mask8bit = 0xff
-            x = i & mask8bit
-            y = (i >> 8) & mask8bit
-            z = (i >> 16) & mask8bit
-            return [x, y, z]
-        uv_type = 'f' * self.use_float32 + 'e' * (not self.use_float32)
-        parsed = struct.unpack('<' + ('I' * 2 + uv_type * 2 * self.uv_num) * self.size, self.buf)
-        stride = 2 + 2 * self.uv_num
-        normals = [parsed[i * stride + 1] for i in range(self.size)]
-        normal = [unpack(n) for n in normals]
-        texcoords = []
-        for j in range(self.uv_num):
-            texcoord = [parsed[i * stride + 2 + j * 2: i * stride + 2 + j * 2 + 2] for i in range(self.size)]
-            texcoords.append(texcoord)
+        vertices = self.get_vertices()
+        normal = vertices['normal'][:, :3]
+        texcoords = vertices['texcoords'].transpose(1, 0, 2)
         return normal, texcoords
 
     def import_from_blender(self, normal, texcoords, uv_num):
         """Update buffer."""
-        uv_type = 'f' * self.use_float32 + 'e' * (not self.use_float32)
         self.uv_num = uv_num
         self.stride = 8 + (1 + self.use_float32) * 4 * self.uv_num
         self.size = len(normal)
         self.vertex_num = self.size
-        buf = normal
-        for texcoord in texcoords:
-            buf = [b + t for b, t in zip(buf, texcoord)]
-        buf = flatten(buf)
-        self.buf = struct.pack('<' + ('B' * 8 + uv_type * 2 * self.uv_num) * self.size, *buf)
+        self.buf = pack_vertices(normal, texcoords, self.uv_num, self.use_float32)
 
 
 class ColorVertexBuffer(VertexBuffer):
     """Vertex colors."""
+    HEADER = struct.Struct('<HII')  # 1, stride, vertex_num
+
     @staticmethod
     def read(f, name=''):
         """Read function."""
-        one = io.read_uint16(f)
+        one, stride, vertex_num = ColorVertexBuffer.HEADER.unpack(f.read(ColorVertexBuffer.HEADER.size))
         io.check(one, 1, f)
-        stride = io.read_uint32(f)
-        vertex_num = io.read_uint32(f)
         if stride > 0:
             buf = Buffer.read(f, name=name)
             io.check(stride, buf.stride)
@@ -271,17 +283,32 @@ class ColorVertexBuffer(VertexBuffer):
     @staticmethod
     def write(f, vb):
         """Write function."""
-        io.write_uint16(f, 1)
-        io.write_uint32(f, vb.stride)
-        io.write_uint32(f, vb.vertex_num)
+        f.write(ColorVertexBuffer.HEADER.pack(1, vb.stride, vb.vertex_num))
         if vb.buf is not None:
             Buffer.write(f, vb)
 
+    def parse(self):
+        """Parse buffer as (vertex_num, 4) colors."""
+        if self.buf is None:
+            return None
+        return np.frombuffer(self.view(), dtype=np.uint8).reshape(self.size, 4)
+
+    def import_from_blender(self, colors):
+        """Update buffer with (vertex_num, 4) colors."""
+        colors = np.asarray(colors)
+        if colors.ndim != 2 or colors.shape[1] != 4:
+            raise RuntimeError(f'Vertex colors should be a (vertex_num, 4) array. (shape: {colors.shape})')
+        io.check_int_range(colors, 'B')
+        self.stride = 4
+        self.size = len(colors)
+        self.vertex_num = self.size
+        self.buf = colors.astype(np.uint8).tobytes()
+
     def update(self, vertex_count):
         """Update buffer."""
         self.vertex_num = vertex_count
         self.size = vertex_count
-        self.buf = b'ff' * self.size * self.stride
+        self.buf = b'\xff' * (self.size * self.stride)
 
     def disable(self):
         """Disable vertex colors."""
@@ -292,6 +319,9 @@ class ColorVertexBuffer(VertexBuffer):
 
 class SkeletalMeshVertexBuffer(VertexBuffer):
     """Normals, positions, and UV maps for UE4 skeletal mesh."""
+    HEADER = struct.Struct('<HII')  # 1, uv_num, use_float32UV
+    MESH_BOUNDS = struct.pack('<3f3I', 1.0, 1.0, 1.0, 0, 0, 0)  # MeshExtension, MeshOrigin
+
     def __init__(self, uv_num, use_float32, scale, stride, size, buf, offset, name):
         """Constructor."""
         self.uv_num = uv_num
@@ -302,79 +332,66 @@ class SkeletalMeshVertexBuffer(VertexBuffer):
     @staticmethod
     def read(f, name=''):
         """Read function."""
-        one = io.read_uint16(f)
+        one, uv_num, use_float32UV = SkeletalMeshVertexBuffer.HEADER.unpack(
+            f.read(SkeletalMeshVertexBuffer.HEADER.size))
         io.check(one, 1, f)
-        uv_num = io.read_uint32(f)
-        use_float32UV = io.read_uint32(f)
-        scale = io.read_vec3_f32(f)
-        io.check(scale, [1, 1, 1], 'SkeletalMeshVertexBuffer: MeshExtension is not (1.0, 1.0 ,1.0))')
-        io.read_null_array(f, 3, 'SkeletalMeshVertexBuffer: MeshOrigin is not (0,0,0))')
+        if f.read(24) != SkeletalMeshVertexBuffer.MESH_BOUNDS:
+            raise RuntimeError('SkeletalMeshVertexBuffer: MeshExtension is not (1.0, 1.0 ,1.0) '
+                               'or MeshOrigin is not (0,0,0))')
+        scale = [1.0, 1.0, 1.0]
         buf = Buffer.read(f, name=name)
         return SkeletalMeshVertexBuffer(uv_num, use_float32UV, scale, buf.stride, buf.size, buf.buf, buf.offset, name)
 
     @staticmethod
     def write(f, vb):
         """Write function."""
-        io.write_uint16(f, 1)
-        io.write_uint32(f, vb.uv_num)
-        io.write_uint32(f, vb.use_float32)
-        io.write_vec3_f32(f, vb.scale)
-        io.write_null_array(f, 3)
+        f.write(SkeletalMeshVertexBuffer.HEADER.pack(1, vb.uv_num, vb.use_float32))
+        f.write(struct.pack('<3f3I', *vb.scale, 0, 0, 0))  # MeshExtension, MeshOrigin
         Buffer.write(f, vb)
 
+    def get_vertices(self):
+        """Get buffer as a structured array (tangent, normal, position, texcoords)."""
+        return np.frombuffer(self.view(), dtype=get_vertex_dtype(self.uv_num, self.use_float32, with_position=True))
+
     def parse(self):
         """Parse buffer."""
-        def unpack(i):
-            mask8bit = 0xff
-            x = i & mask8bit
-            y = (i >> 8) & mask8bit
-            z = (i >> 16) & mask8bit
-            return [x, y, z]
-        uv_type = 'f' * self.use_float32 + 'e' * (not self.use_float32)
-        parsed = struct.unpack('<' + ('I' * 2 + 'fff' + uv_type * 2 * self.uv_num) * self.size, self.buf)
-        stride = 5 + 2 * self.uv_num
-        normals = [parsed[i * stride + 1] for i in range(self.size)]
-        normal = [unpack(n) for n in normals]
-        # tangent = [n[0:4] for n in normals]
-        position = [parsed[i * stride + 2: i * stride + 5] for i in range(self.size)]
-        texcoords = []
-        for j in range(self.uv_num):
-            texcoord = [parsed[i * stride + 5 + j * 2: i * stride + 5 + j * 2 + 2] for i in range(self.size)]
-            texcoords.append(texcoord)
+        vertices = self.get_vertices()
+        normal = vertices['normal'][:, :3]
+        # tangent = vertices['tangent'][:, :3]
+        position = vertices['position']
+        texcoords = vertices['texcoords'].transpose(1, 0, 2)
         return normal, position, texcoords
 
     def get_range(self):
         """Get range of vertex positions."""
-        uv_type = 'f' * self.use_float32 + 'e' * (not self.use_float32)
-        parsed = struct.unpack('<' + ('B' * 8 + 'fff' + uv_type * 2 * self.uv_num) * self.size, self.buf)
-        stride = 11 + 2 * self.uv_num
-        position = [parsed[i * stride + 8: i * stride + 11] for i in range(self.size)]
-        x = [pos[0] for pos in position]
-        y = [pos[1] for pos in position]
-        z = [pos[2] for pos in position]
-        return [max(x) - min(x), max(y) - min(y), max(z) - min(z)]
+        position = self.get_vertices()['position']
+        return (position.max(axis=0).astype(np.float64) - position.min(axis=0)).tolist()
 
     def import_from_blender(self, normal, position, texcoords, uv_num):
         """Update buffer."""
-        uv_type = 'f' * self.use_float32 + 'e' * (not self.use_float32)
         self.uv_num = uv_num
         self.stride = 20 + (1 + self.use_float32) * 4 * self.uv_num
         self.size = len(normal)
         self.vertex_num = self.size
-        buf = [n + p for n, p in zip(normal, position)]
-        for texcoord in texcoords:
-            buf = [b + t for b, t in zip(buf, texcoord)]
-        buf = flatten(buf)
-        self.buf = struct.pack('<' + ('B' * 8 + 'fff' + uv_type * 2 * self.uv_num) * self.size, *buf)
+        self.buf = pack_vertices(normal, texcoords, self.uv_num, self.use_float32, position=position)
+
+
+def split_skin_weights(buf, vertex_num, influence_count):
+    """Get joints and weights as (vertex_num, influence_count) views of a skin weight buffer."""
+    stride = influence_count * 2
+    parsed = np.frombuffer(buf, dtype=np.uint8, count=vertex_num * stride).reshape(vertex_num, stride)
+    return parsed[:, :influence_count], parsed[:, influence_count:]
 
 
-def flatten(array):
-    """Flatten list."""
-    return [x for row in array for x in row]
+def join_skin_weights(joint, weight):
+    """Interleave joints and weights per vertex."""
+    return np.concatenate([np.asarray(joint, dtype=np.uint8), np.asarray(weight, dtype=np.uint8)], axis=1)
 
 
 class SkinWeightVertexBuffer4(VertexBuffer):
     """Skin weights for UE4 skeletal mesh."""
+    HEADER = struct.Struct('<HII')  # 1, extra_bone_flag, vertex_num
+
     def __init__(self, extra_bone_flag, stride, size, buf, offset, name):
         """Constructor."""
         self.extra_bone_flag = extra_bone_flag
@@ -383,10 +400,10 @@ class SkinWeightVertexBuffer4(VertexBuffer):
     @staticmethod
     def read(f, name=''):
         """Read function."""
-        one = io.read_uint16(f)
+        # extra_bone_flag: if stride is 16 or not
+        one, extra_bone_flag, vertex_num = SkinWeightVertexBuffer4.HEADER.unpack(
+            f.read(SkinWeightVertexBuffer4.HEADER.size))
         io.check(one, 1, f)
-        extra_bone_flag = io.read_uint32(f)  # if stride is 16 or not
-        vertex_num = io.read_uint32(f)
         buf = Buffer.read(f, name=name)
         io.check(vertex_num, buf.size, f)
         io.check(extra_bone_flag, buf.stride == 16, f)
@@ -395,17 +412,12 @@ class SkinWeightVertexBuffer4(VertexBuffer):
     @staticmethod
     def write(f, vb):
         """Write function."""
-        io.write_uint16(f, 1)
-        io.write_uint32(f, vb.extra_bone_flag)
-        io.write_uint32(f, vb.vertex_num)
+        f.write(SkinWeightVertexBuffer4.HEADER.pack(1, vb.extra_bone_flag, vb.vertex_num))
         Buffer.write(f, vb)
 
     def parse(self):
         """Parse buffer."""
-        parsed = struct.unpack('<' + 'B' * len(self.buf), self.buf)
-        joint = [parsed[i * self.stride: i * self.stride + self.stride // 2] for i in range(self.size)]
-        weight = [parsed[i * self.stride + self.stride // 2: (i + 1) * self.stride] for i in range(self.size)]
-        return joint, weight
+        return split_skin_weights(self.view(), self.size, self.stride // 2)
 
     def import_from_blender(self, joint, weight, extra_bone_flag):
         """Update buffer."""
@@ -413,13 +425,13 @@ class SkinWeightVertexBuffer4(VertexBuffer):
         self.vertex_num = self.size
         self.extra_bone_flag = extra_bone_flag
         self.stride = 8 * (1 + self.extra_bone_flag)
-        buf = [j + w for j, w in zip(joint, weight)]
-        buf = flatten(buf)
-        self.buf = struct.pack('<' + 'B' * self.size * self.stride, *buf)
+        self.buf = join_skin_weights(joint, weight).tobytes()
 
 
 class SkinWeightVertexBuffer5(VertexBuffer):
     """Skin weights for UE5 skeletal mesh."""
+    HEADER = struct.Struct('<HIIIII')  # 1, 0, influence_count, influence_x_vertex, vertex_count, 0
+
     def __init__(self, influence_count, stride, size, buf, offset, name):
         """Constructor."""
         self.influence_count = influence_count
@@ -428,59 +440,61 @@ class SkinWeightVertexBuffer5(VertexBuffer):
     @staticmethod
     def read(f, name=''):
         """Read function."""
-        one = io.read_uint16(f)
+        one, null, influence_count, influence_x_vertex, vertex_count, null2 = SkinWeightVertexBuffer5.HEADER.unpack(
+            f.read(SkinWeightVertexBuffer5.HEADER.size))
         io.check(one, 1, f)
-        io.read_null(f)
-        influence_count = io.read_uint32(f)
-        influence_x_vertex = io.read_uint32(f)
-        vertex_count = io.read_uint32(f)
+        io.check(null, 0, f, 'Not NULL!')
         io.check(influence_count * vertex_count, influence_x_vertex)
-        io.read_null(f)
+        io.check(null2, 0, f, 'Not NULL!')
         buf = Buffer.read(f, name=name)
         return SkinWeightVertexBuffer5(influence_count, buf.stride, buf.size, buf.buf, buf.offset, name)
 
     @staticmethod
     def write(f, vb):
         """Write function."""
-        io.write_uint16(f, 1)
-        io.write_null(f)
-        io.write_uint32(f, vb.influence_count)
-        io.write_uint32(f, vb.size // 2)
-        io.write_uint32(f, vb.size // 2 // vb.influence_count)
-        io.write_null(f)
+        influence_x_vertex = vb.size // 2
+        vertex_count = influence_x_vertex // vb.influence_count
+        f.write(SkinWeightVertexBuffer5.HEADER.pack(1, 0, vb.influence_count, influence_x_vertex, vertex_count, 0))
         Buffer.write(f, vb)
 
     def parse(self):
         """Parse buffer."""
-        parsed = struct.unpack('<' + 'B' * len(self.buf), self.buf)
-        stride = self.influence_count * 2
-        size = self.size // self.influence_count // 2
-        joint = [parsed[i * stride: i * stride + self.influence_count] for i in range(size)]
-        weight = [parsed[i * stride + stride // 2: (i + 1) * stride] for i in range(size)]
-        return joint, weight
+        vertex_num = self.size // (self.influence_count * 2)
+        return split_skin_weights(self.view(), vertex_num, self.influence_count)
 
     def import_from_blender(self, joint, weight):
         """Update buffer."""
         self.influence_count = len(joint[0])
-        buf = [j + w for j, w in zip(joint, weight)]
-        buf = flatten(buf)
-        self.size = len(buf)
-        self.buf = struct.pack('<' + 'B' * self.size * self.stride, *buf)
+        buf = join_skin_weights(joint, weight)
+        self.size = buf.size
+        self.buf = buf.tobytes()
+
+
+INDEX_DTYPE = {2: '<u2', 4: '<u4'}  # stride -> dtype
 
 
 class StaticIndexBuffer(Buffer):
     """Index buffer for static mesh."""
+    HEADER = struct.Struct('<III')  # uint32_flag, and buffer header
+
     def __init__(self, uint32_flag, stride, size, ib, offset, name, version):
         """Constructor."""
         self.uint32_flag = uint32_flag
         self.version = version
         super().__init__(stride, size, ib, offset, name)
+        self.update_meta()
+
+    def update_meta(self):
+        """Cache stride and count of indices."""
+        self.index_stride = 2 + 2 * self.uint32_flag
+        self.index_count = len(self.buf) // self.index_stride
 
     @staticmethod
     def read(f, version, name=''):
         """Read function."""
-        uint32_flag = io.read_uint32(f)  # 0: uint16 id, 1: uint32 id
-        buf = Buffer.read(f, name=name)
+        # uint32_flag: 0 for uint16 ids, 1 for uint32 ids
+        uint32_flag, stride, size = StaticIndexBuffer.HEADER.unpack(f.read(StaticIndexBuffer.HEADER.size))
+        buf = Buffer.read_data(f, stride, size, name=name)
         if version >= '4.27':
             io.read_null(f)
         # buf.stride==1
@@ -490,33 +504,28 @@ class StaticIndexBuffer(Buffer):
     @staticmethod
     def write(f, ib):
         """Write function."""
-        io.write_uint32(f, ib.uint32_flag)
-        Buffer.write(f, ib)
+        f.writelines([StaticIndexBuffer.HEADER.pack(ib.uint32_flag, ib.stride, ib.size), ib.buf])
         if ib.version >= '4.27':
             io.write_null(f)
 
     def get_meta(self):
         """Get meta data."""
-        stride = 2 + 2 * self.uint32_flag
-        size = len(self.buf) // stride
-        return self.offset, stride, size
+        return self.offset, self.index_stride, self.index_count
 
     def parse(self):
         """Parse buffer."""
-        _, stride, size = self.get_meta()
-        form = [None, None, 'H', None, 'I']
-        indices = struct.unpack('<' + form[stride] * size, self.buf)
+        indices = np.frombuffer(self.view(), dtype=INDEX_DTYPE[self.index_stride], count=self.index_count)
         return indices
 
     def update(self, new_ids, use_uint32=False):
         """Update buffer."""
-        form = [None, None, 'H', None, 'I']
         self.uint32_flag = use_uint32
         stride = 2 + 2 * use_uint32
         size = len(new_ids)
         self.size = size * stride
         self.stride = 1
-        self.buf = struct.pack('<' + form[stride] * size, *new_ids)
+        self.buf = np.asarray(new_ids, dtype=INDEX_DTYPE[stride]).tobytes()
+        self.update_meta()
 
     def disable(self):
         """Disable buffer."""
@@ -525,51 +534,50 @@ class StaticIndexBuffer(Buffer):
 
 class SkeletalIndexBuffer(Buffer):
     """Index buffer for skeletal mesh."""
+    HEADER = struct.Struct('<BII')  # stride (2: uint16 id, 4: uint32 id), and buffer header
 
     @staticmethod
     def read(f, name=''):
         """Read function."""
-        stride = io.read_uint8(f)  # 2: uint16 id, 4: uint32 id
-        buf = Buffer.read(f, name=name)
-        io.check(stride, buf.stride)
+        stride, buf_stride, size = SkeletalIndexBuffer.HEADER.unpack(f.read(SkeletalIndexBuffer.HEADER.size))
+        io.check(stride, buf_stride)
+        buf = Buffer.read_data(f, buf_stride, size, name=name)
         return SkeletalIndexBuffer(buf.stride, buf.size, buf.buf, buf.offset, name)
 
     @staticmethod
     def write(f, ib):
         """Write function."""
-        io.write_uint8(f, ib.stride)
-        Buffer.write(f, ib)
+        f.writelines([SkeletalIndexBuffer.HEADER.pack(ib.stride, ib.stride, ib.size), ib.buf])
 
     def parse(self):
         """Parse buffer."""
-        form = [None, None, 'H', None, 'I']
-        indices = struct.unpack('<' + form[self.stride] * self.size, self.buf)
+        indices = np.frombuffer(self.view(), dtype=INDEX_DTYPE[self.stride], count=self.size)
         return indices
 
     def update(self, new_ids, stride):
         """Update buffer."""
-        form = [None, None, 'H', None, 'I']
         self.size = len(new_ids)
         # new_ids = [new_ids[i*3:(i+1)*3] for i in range(self.size//3)]
         # new_ids = [[ids[0], ids[2], ids[1]] for ids in new_ids]
         # new_ids = flatten(new_ids)
         # print(len(new_ids))
         self.stride = stride
-        self.buf = struct.pack('<' + form[self.stride] * self.size, *new_ids)
+        self.buf = np.asarray(new_ids, dtype=INDEX_DTYPE[self.stride]).tobytes()
 
 
 class KDIBuffer(Buffer):
     """KDI buffers."""
+    HEADER = struct.Struct('<HII')  # 1, and buffer header
+
     @staticmethod
     def read(f, name=''):
         """Read function."""
-        one = io.read_uint16(f)
+        one, stride, size = KDIBuffer.HEADER.unpack(f.read(KDIBuffer.HEADER.size))
         io.check(one, 1, f)
-        buf = Buffer.read(f, name=name)
+        buf = Buffer.read_data(f, stride, size, name=name)
         return KDIBuffer(buf.stride, buf.size, buf.buf, buf.offset, name)
 
     @staticmethod
     def write(f, vb):
         """Write function."""
-        io.write_uint16(f, 1)
-        Buffer.write(f, vb)
+        f.writelines([KDIBuffer.HEADER.pack(1, vb.stride, vb.size), vb.buf])
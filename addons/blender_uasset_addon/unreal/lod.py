@@ -1,6 +1,8 @@
 """Classes for LOD."""
 
+import copy
 import struct
+import numpy as np
 from ..util import io_util as io
 
 from .lod_section import StaticLODSection, SkeletalLODSection4, SkeletalLODSection5
@@ -14,7 +16,8 @@ from .buffer import (PositionVertexBuffer,
                      SkinWeightVertexBuffer5,
                      NormalVertexBuffer,
                      UVVertexBuffer,
-                     KDIBuffer)
+                     KDIBuffer,
+                     INDEX_DTYPE)
 
 
 class LOD:
@@ -41,6 +44,45 @@ class LOD:
         for section in self.sections:
             section.update_material_ids(new_material_ids)
 
+    def resize_sections(self, section_num):
+        """Copy the last section or remove sections to have the specified number of sections.
+
+        Notes:
+            New sections are shallow copies of the last one, including KDI data of ff7r.
+            Callers should overwrite them with import_from_blender and call remove_KDI if needed.
+        """
+        if len(self.sections) < section_num:
+            last_section = self.sections[-1]
+            self.sections += [copy.copy(last_section) for i in range(section_num - len(self.sections))]
+        else:
+            del self.sections[section_num:]
+
+    def update_section_offsets(self):
+        """Cache first vertex ids and first index ids of sections as arrays."""
+        offsets = np.array([(section.first_vertex_id, section.first_ib_id) for section in self.sections],
+                           dtype=np.int64).reshape(-1, 2)
+        self.first_vertex_ids = offsets[:, 0]
+        self.first_ib_ids = offsets[:, 1]
+
+    def parse_indices(self):
+        """Split index buffer by sections and make indices relative to the first vertex of each section."""
+        indices = self.ib.parse()
+        if len(self.sections) == 0:
+            return []
+        # sections might not be sorted by first_ib_id
+        order = np.argsort(self.first_ib_ids, kind='stable')
+        first_ib_ids = self.first_ib_ids[order]
+        counts = np.diff(first_ib_ids, append=len(indices))
+        # use a signed type to get negative values instead of wrapped ones for broken sections
+        signed_type = np.promote_types(indices.dtype, np.int8)
+        offsets = np.repeat(self.first_vertex_ids[order].astype(signed_type), counts)
+        rebased = np.subtract(indices[first_ib_ids[0]:], offsets, dtype=signed_type)
+        splitted = split_list(rebased, first_ib_ids - first_ib_ids[0])
+        section_indices = [None] * len(splitted)
+        for i, ids in zip(order, splitted):
+            section_indices[i] = ids
+        return section_indices
+
     def get_meta_for_blender(self):
         """Get meta data for Blender."""
         material_ids = [section.material_id for section in self.sections]
@@ -48,15 +90,44 @@ class LOD:
 
 
 def split_list(array, first_ids):
-    """Split list by ids."""
-    last_ids = first_ids[1:] + [len(array)]
+    """Split list by ids.
+
+    ndarrays are split into views without copying elements.
+    """
+    if isinstance(array, np.ndarray):
+        first_id = first_ids[0]
+        return np.split(array[first_id:], [i - first_id for i in first_ids[1:]])
+    last_ids = list(first_ids[1:]) + [len(array)]
     splitted = [array[first: last] for first, last in zip(first_ids, last_ids)]
     return splitted
 
 
-def flatten(array):
-    """Flatten a list."""
-    return [x for row in array for x in row]
+def split_texcoords(texcoords, first_ids):
+    """Split uv maps (uv_num, vertex_num, 2) by ids into a list of (uv_num, section_num) views."""
+    splitted = split_list(texcoords.transpose(1, 0, 2), first_ids)
+    return [[tc[:, j] for tc in splitted] for j in range(len(texcoords))]
+
+
+def get_first_ids(counts):
+    """Get the first id of each chunk from chunk sizes."""
+    return np.cumsum([0] + list(counts[:-1])).tolist()
+
+
+def rebase_indices(indices, first_ids, dtype):
+    """Offset indices of each section by its first vertex id and join them into an array."""
+    joined = np.empty(sum(len(ids) for ids in indices), dtype=dtype)
+    limit = np.iinfo(dtype).max
+    pos = 0
+    for ids, first_id in zip(indices, first_ids):
+        ids = np.asarray(ids)
+        num = len(ids)
+        if num > 0 and (int(ids.min()) + first_id < 0 or int(ids.max()) + first_id > limit):
+            raise OverflowError(f'Indices are out of range for {np.dtype(dtype)}. (first vertex id: {first_id})')
+        section = joined[pos:pos + num]
+        section[:] = ids
+        section += first_id
+        pos += num
+    return joined
 
 
 class StaticLOD(LOD):
@@ -75,9 +146,8 @@ class StaticLOD(LOD):
         self.adjacency_ib = adjacency_ib
         self.unk = unk
         self.unk2 = unk2
-        self.face_num = 0
-        for section in self.sections:
-            self.face_num += section.face_num
+        self.face_num = sum(section.face_num for section in self.sections)
+        self.update_section_offsets()
 
     @staticmethod
     def read(f, version):
@@ -86,16 +156,15 @@ class StaticLOD(LOD):
         one = io.read_uint8(f)
         io.check(one, 1, f)
         unk = io.read_uint8(f)
-        sections = [StaticLODSection.read(f, version) for i in range(io.read_uint32(f))]
+        sections = StaticLODSection.read_array(f, version)
 
         flags = f.read(4 + 10 * (version >= '4.27'))
         vb = PositionVertexBuffer.read(f, name='VB0')  # xyz
         if version >= '4.27':
-            io.check(io.read_uint16(f), 1)
-            uv_num = io.read_uint32(f)
-            _ = io.read_uint32(f)  # vertex num
-            use_float32UV = io.read_uint32(f)
-            io.read_null(f)  # use high precision tangent basis?
+            one, uv_num, _, use_float32UV, null = UVVertexBuffer.VERTEX_HEADER.unpack(
+                f.read(UVVertexBuffer.VERTEX_HEADER.size))
+            io.check(one, 1, f)
+            io.check(null, 0, f)
             normal_vb = NormalVertexBuffer.read(f, name='Normal_VB')
             vb2 = UVVertexBuffer.read(f, uv_num, use_float32UV, name='UV_VB')
         else:
@@ -121,11 +190,7 @@ class StaticLOD(LOD):
         f.write(lod.flags)
         PositionVertexBuffer.write(f, lod.vb)
         if lod.version >= '4.27':
-            io.write_uint16(f, 1)
-            io.write_uint32(f, lod.vb2.uv_num)
-            io.write_uint32(f, lod.vb.vertex_num)
-            io.write_uint32(f, lod.vb2.use_float32UV)
-            io.write_null(f)
+            f.write(UVVertexBuffer.VERTEX_HEADER.pack(1, lod.vb2.uv_num, lod.vb.vertex_num, lod.vb2.use_float32UV, 0))
             NormalVertexBuffer.write(f, lod.normal_vb)
             UVVertexBuffer.write(f, lod.vb2)
         else:
@@ -144,11 +209,11 @@ class StaticLOD(LOD):
         """Print meta data."""
         pad = ' ' * padding
         print(pad + f'LOD{i} (offset: {self.offset})')
-        for sec, j in zip(self.sections, range(len(self.sections))):
+        for j, sec in enumerate(self.sections):
             sec.print(j, padding=padding + 2)
-        print(pad + f'face_count: {self.face_num}')
-        print(pad + f'vertex_count: {self.vb.vertex_num}')
-        print(pad + f'uv_count: {self.uv_num}')
+        print('\n'.join([pad + f'face_count: {self.face_num}',
+                         pad + f'vertex_count: {self.vb.vertex_num}',
+                         pad + f'uv_count: {self.uv_num}']))
         for buf in self.get_buffers():
             buf.print(padding=padding + 2)
 
@@ -160,17 +225,14 @@ class StaticLOD(LOD):
             texcoords = self.vb2.parse()
         else:
             normal, texcoords = self.vb2.parse()
-        first_vertex_ids = [section.first_vertex_id for section in self.sections]
+        first_vertex_ids = self.first_vertex_ids
 
         ary = [normal, pos]
         normals, positions = [split_list(elem, first_vertex_ids) for elem in ary]
 
-        texcoords = [split_list(tc, first_vertex_ids) for tc in texcoords]
+        texcoords = split_texcoords(texcoords, first_vertex_ids)
 
-        indices = self.ib.parse()
-        first_ib_ids = [section.first_ib_id for section in self.sections]
-        indices = split_list(indices, first_ib_ids)
-        indices = [[i - first_id for i in ids] for ids, first_id in zip(indices, first_vertex_ids)]
+        indices = self.parse_indices()
 
         return normals, positions, texcoords, None, None, None, indices
 
@@ -181,7 +243,7 @@ class StaticLOD(LOD):
         v_num1 = self.vb.vertex_num
         uv_num1 = self.uv_num
 
-        uv_maps = primitives['UV_MAPS']  # (sction count, uv count, vertex count, 2)
+        uv_maps = np.asarray(primitives['UV_MAPS'], dtype=np.float32)  # (uv count, vertex count, 2)
         self.uv_num = len(uv_maps)
         # pos_range = self.vb.get_range()
         positions = primitives['POSITIONS']
@@ -192,29 +254,26 @@ class StaticLOD(LOD):
         material_ids = primitives['MATERIAL_IDS']
         indices = primitives['INDICES']
 
-        if len(self.sections) < len(material_ids):
-            self.sections += [self.sections[-1].copy() for i in range(len(material_ids) - len(self.sections))]
-        self.sections = self.sections[:len(material_ids)]
+        self.resize_sections(len(material_ids))
 
         vertex_count = primitives['VERTEX_COUNTS']
         if self.color_vb.buf is not None:
             self.color_vb.update(sum(vertex_count))
         face_count = [len(ids) // 3 for ids in indices]
-        first_vertex_id = 0
-        first_ids = []
-        first_ib_id = 0
-        for section, index, vert_num, face_num in zip(self.sections, material_ids, vertex_count, face_count):
-            first_ids.append(first_vertex_id)
+        first_ids = get_first_ids(vertex_count)
+        first_ib_ids = get_first_ids([num * 3 for num in face_count])
+        for section, index, first_vertex_id, vert_num, first_ib_id, face_num in zip(
+                self.sections, material_ids, first_ids, vertex_count, first_ib_ids, face_count):
             section.import_from_blender(index, first_vertex_id, vert_num, first_ib_id, face_num)
-            first_vertex_id += vert_num
-            first_ib_id += face_num * 3
+        self.update_section_offsets()
 
         self.vb2.import_from_blender(normals, uv_maps, self.uv_num)
-        indices = [[i + first_id for i in ids] for ids, first_id in zip(indices, first_ids)]
-        indices = flatten(indices)
+        use_uint32 = self.vb.size > 65000
+        index_dtype = INDEX_DTYPE[2 + 2 * use_uint32]
+        indices = rebase_indices(indices, first_ids, index_dtype)
 
         self.color_vb.disable()
-        self.ib.update(indices, use_uint32=self.vb.size > 65000)
+        self.ib.update(indices, use_uint32=use_uint32)
         self.reversed_ib.disable()
         self.ib2.disable()
         self.reversed_ib2.disable()
@@ -225,11 +284,11 @@ class StaticLOD(LOD):
         v_num2 = self.vb.vertex_num
         uv_num2 = self.uv_num
 
-        print('Updated LOD0')
-        print(f'  sections: {s_num1} -> {s_num2}')
-        print(f'  faces: {f_num1} -> {f_num2}')
-        print(f'  vertices: {v_num1} -> {v_num2}')
-        print(f'  uv maps: {uv_num1} -> {uv_num2}')
+        print('\n'.join(['Updated LOD0',
+                         f'  sections: {s_num1} -> {s_num2}',
+                         f'  faces: {f_num1} -> {f_num2}',
+                         f'  vertices: {v_num1} -> {v_num2}',
+                         f'  uv maps: {uv_num1} -> {uv_num2}']))
 
 
 class SkeletalLOD(LOD):
@@ -245,12 +304,12 @@ class SkeletalLOD(LOD):
         """Print meta data."""
         pad = ' ' * padding
         print(pad + f'LOD{name} (offset: {self.offset})')
-        for sec, i in zip(self.sections, range(len(self.sections))):
+        for i, sec in enumerate(self.sections):
             sec.print(str(i), bones, padding=padding + 2)
         pad += ' ' * padding
-        print(pad + f'face count: {self.ib.size // 3}')
-        print(pad + f'vertex count: {self.vb.vertex_num}')
-        print(pad + f'uv count: {self.uv_num}')
+        print('\n'.join([pad + f'face count: {self.ib.size // 3}',
+                         pad + f'vertex count: {self.vb.vertex_num}',
+                         pad + f'uv count: {self.uv_num}']))
         for buf in self.get_buffers():
             if buf is not None:
                 buf.print(padding=padding + 2)
@@ -263,6 +322,7 @@ class SkeletalLOD4(SkeletalLOD):
     # active_bone_ids: maybe bone ids. but I don't know how it works.
     # bone_ids: active bone ids?
     # uv_num: the number of uv maps
+    HEADER = struct.Struct('<BBI')  # (1, no_tessellation, section count)
 
     @staticmethod
     def read(f, version):
@@ -273,37 +333,32 @@ class SkeletalLOD4(SkeletalLOD):
         """Read function."""
         self.offset = f.tell()
         self.version = version
-        one = io.read_uint8(f)
+        one, no_tessellation, section_num = SkeletalLOD4.HEADER.unpack(f.read(SkeletalLOD4.HEADER.size))
         io.check(one, 1, f, 'Parse failed! (LOD:one)')
-        no_tessellation = io.read_uint8(f)
-        self.sections = [SkeletalLODSection4.read(f, self.version) for i in range(io.read_uint32(f))]
+        self.sections = [SkeletalLODSection4.read(f, self.version) for i in range(section_num)]
 
-        self.KDI_buffer_size = 0
-        for section in self.sections:
-            if section.unk2 is not None:
-                self.KDI_buffer_size += len(section.unk2) // 16
+        self.KDI_buffer_size = sum(len(section.unk2) // 16 for section in self.sections
+                                   if section.unk2 is not None)
+        self.update_section_offsets()
 
         self.ib = SkeletalIndexBuffer.read(f, name='IB')
 
-        num = io.read_uint32(f)
-        self.active_bone_ids = f.read(num * 2)
+        self.active_bone_ids = np.frombuffer(f.read(io.read_uint32(f) * 2), dtype='<u2')
 
         io.read_null(f, 'Parse failed! (LOD:null1)')
 
         _ = io.read_uint32(f)  # vertex num
 
-        num = io.read_uint32(f)
-        self.required_bone_ids = f.read(num * 2)
+        self.required_bone_ids = np.frombuffer(f.read(io.read_uint32(f) * 2), dtype='<u2')
 
-        self.vertex_map = io.read_uint32_array(f)
+        self.vertex_map = np.frombuffer(f.read(io.read_uint32(f) * 4), dtype='<u4')
         self.max_vertex_map_id = io.read_uint32(f)
 
         self.uv_num = io.read_uint32(f)
         self.vb = SkeletalMeshVertexBuffer.read(f, name='VB0')
         io.check(self.uv_num, self.vb.uv_num)
         self.vb2 = SkinWeightVertexBuffer4.read(f, name='VB2')
-        test = io.read_uint8(f)
-        f.seek(-1, 1)
+        test = io.peek_uint8(f)
         if test == 1 and not no_tessellation:  # HasVertexColors
             self.color_vb = ColorVertexBuffer.read(f, name='ColorVB')
         else:
@@ -322,16 +377,13 @@ class SkeletalLOD4(SkeletalLOD):
     @staticmethod
     def write(f, lod):
         """Write function."""
-        io.write_uint8(f, 1)
-        io.write_uint8(f, lod.ib2 is None)
-        io.write_array(f, lod.sections, SkeletalLODSection4.write, with_length=True)
+        f.write(SkeletalLOD4.HEADER.pack(1, lod.ib2 is None, len(lod.sections)))
+        io.write_array(f, lod.sections, SkeletalLODSection4.write)
         SkeletalIndexBuffer.write(f, lod.ib)
-        io.write_uint32(f, len(lod.active_bone_ids) // 2)
-        f.write(lod.active_bone_ids)
+        io.write_uint16_array(f, lod.active_bone_ids, with_length=True)
         io.write_null(f)
         io.write_uint32(f, lod.vb.vertex_num)
-        io.write_uint32(f, len(lod.required_bone_ids) // 2)
-        f.write(lod.required_bone_ids)
+        io.write_uint16_array(f, lod.required_bone_ids, with_length=True)
 
         io.write_uint32_array(f, lod.vertex_map, with_length=True)
         io.write_uint32(f, lod.max_vertex_map_id)
@@ -362,18 +414,15 @@ class SkeletalLOD4(SkeletalLOD):
         """Get mesh data for Blender."""
         normal, pos, texcoords = self.vb.parse()
         joint, weight = self.vb2.parse()
-        first_vertex_ids = [section.first_vertex_id for section in self.sections]
+        first_vertex_ids = self.first_vertex_ids
         vertex_groups = [section.vertex_group for section in self.sections]
 
         ary = [normal, pos, joint, weight]
         normals, positions, joints, weights = [split_list(elem, first_vertex_ids) for elem in ary]
 
-        texcoords = [split_list(tc, first_vertex_ids) for tc in texcoords]
+        texcoords = split_texcoords(texcoords, first_vertex_ids)
 
-        indices = self.ib.parse()
-        first_ib_ids = [section.first_ib_id for section in self.sections]
-        indices = split_list(indices, first_ib_ids)
-        indices = [[i - first_id for i in ids] for ids, first_id in zip(indices, first_vertex_ids)]
+        indices = self.parse_indices()
         return normals, positions, texcoords, vertex_groups, joints, weights, indices
 
     def import_from_blender(self, primitives):
@@ -383,11 +432,10 @@ class SkeletalLOD4(SkeletalLOD):
         v_num1 = self.vb.vertex_num
         uv_num1 = self.uv_num
 
-        bone_ids = [i for i in range(len(primitives['BONES']))]
-        bone_ids = struct.pack('<' + 'H' * len(bone_ids), *bone_ids)
+        bone_ids = np.arange(len(primitives['BONES']), dtype='<u2')
         self.active_bone_ids = bone_ids
         self.required_bone_ids = bone_ids
-        uv_maps = primitives['UV_MAPS']  # (sction count, uv count, vertex count, 2)
+        uv_maps = np.asarray(primitives['UV_MAPS'], dtype=np.float32)  # (uv count, vertex count, 2)
         self.uv_num = len(uv_maps)
         positions = primitives['POSITIONS']
         normals = primitives['NORMALS']
@@ -401,30 +449,26 @@ class SkeletalLOD4(SkeletalLOD):
         weights = primitives['WEIGHTS']
         indices = primitives['INDICES']
 
-        if len(self.sections) < len(material_ids):
-            self.sections += [self.sections[-1].copy() for i in range(len(material_ids) - len(self.sections))]
-        self.sections = self.sections[:len(material_ids)]
+        self.resize_sections(len(material_ids))
 
         max_bone_influences = len(joints[0])
         face_count = [len(ids) // 3 for ids in indices]
-        first_vertex_id = 0
-        first_ids = []
-        first_ib_id = 0
-        for section, vg, index, vert_num, face_num in zip(self.sections, vertex_groups, material_ids,
-                                                          vertex_count, face_count):
-            first_ids.append(first_vertex_id)
+        first_ids = get_first_ids(vertex_count)
+        first_ib_ids = get_first_ids([num * 3 for num in face_count])
+        for section, vg, index, first_vertex_id, vert_num, first_ib_id, face_num in zip(
+                self.sections, vertex_groups, material_ids, first_ids, vertex_count, first_ib_ids, face_count):
             section.import_from_blender(vg, index, first_vertex_id, vert_num,
                                         first_ib_id, face_num, max_bone_influences)
-            first_vertex_id += vert_num
-            first_ib_id += face_num * 3
+        self.update_section_offsets()
 
         self.vb2.import_from_blender(joints, weights, max_bone_influences > 4)
         self.color_vb = None
 
-        indices = [[i + first_id for i in ids] for ids, first_id in zip(indices, first_ids)]
-        indices = flatten(indices)
+        index_stride = ((self.vb.size > 65000) + 1) * 2
+        index_dtype = INDEX_DTYPE[index_stride]
+        indices = rebase_indices(indices, first_ids, index_dtype)
 
-        self.ib.update(indices, ((self.vb.size > 65000) + 1) * 2)
+        self.ib.update(indices, index_stride)
         self.ib2 = None
         self.remove_KDI()
 
@@ -433,15 +477,17 @@ class SkeletalLOD4(SkeletalLOD):
         v_num2 = self.vb.vertex_num
         uv_num2 = self.uv_num
 
-        print('Updated LOD0')
-        print(f'  sections: {s_num1} -> {s_num2}')
-        print(f'  faces: {f_num1} -> {f_num2}')
-        print(f'  vertices: {v_num1} -> {v_num2}')
-        print(f'  uv maps: {uv_num1} -> {uv_num2}')
+        print('\n'.join(['Updated LOD0',
+                         f'  sections: {s_num1} -> {s_num2}',
+                         f'  faces: {f_num1} -> {f_num2}',
+                         f'  vertices: {v_num1} -> {v_num2}',
+                         f'  uv maps: {uv_num1} -> {uv_num2}']))
 
 
 class SkeletalLOD5(SkeletalLOD):
     """Skeletal LOD for UE5."""
+    HEADER = struct.pack('<HII', 1, 0, 1)
+    WEIGHT_VB_TAIL = struct.pack('<HII', 1, 0, 4)  # followed by null data
 
     @staticmethod
     def read(f, version):
@@ -452,74 +498,54 @@ class SkeletalLOD5(SkeletalLOD):
         """Read function."""
         self.offset = f.tell()
         self.version = version
-        one = io.read_uint16(f)
-        io.check(one, 1, f, 'Parse failed! (LOD:one)')
-        io.read_const_uint32(f, 0)
-        io.read_const_uint32(f, 1)
-        self.active_bone_ids = io.read_uint16_array(f)
+        io.check(f.read(len(SkeletalLOD5.HEADER)), SkeletalLOD5.HEADER, f, 'Parse failed! (LOD:header)')
+        self.active_bone_ids = np.frombuffer(f.read(io.read_uint32(f) * 2), dtype='<u2')
         self.sections = [SkeletalLODSection5.read(f, self.version) for i in range(io.read_uint32(f))]
-        self.required_bone_ids = io.read_uint16_array(f)
+        self.required_bone_ids = np.frombuffer(f.read(io.read_uint32(f) * 2), dtype='<u2')
+        self.update_section_offsets()
         buffer_block_size = io.read_uint32(f)
         buffer_block_start_offset = f.tell()
 
         io.check(io.read_uint16(f), 1)
         self.ib = SkeletalIndexBuffer.read(f, name='IB')
         self.vb = PositionVertexBuffer.read(f, name='Position_VB')
-        io.check(io.read_uint16(f), 1)
-        self.uv_num = io.read_uint32(f)
-        _ = io.read_uint32(f)  # vertex num
-        use_float32UV = io.read_uint32(f)
-        io.read_null(f)  # use high precision tangent basis?
+        one, self.uv_num, _, use_float32UV, null = UVVertexBuffer.VERTEX_HEADER.unpack(
+            f.read(UVVertexBuffer.VERTEX_HEADER.size))
+        io.check(one, 1, f)
+        io.check(null, 0, f)
 
         self.normal_vb = NormalVertexBuffer.read(f, name='Normal_VB')
         self.uv_vb = UVVertexBuffer.read(f, self.uv_num, use_float32UV, name='UV_VB')
 
         self.weight_vb = SkinWeightVertexBuffer5.read(f, name='Weight_VB')
-        io.check(io.read_uint16(f), 1)
-        io.read_null(f)
-        io.read_const_uint32(f, 4)
-        if version >= '5.0':
-            io.read_null_array(f, 4)
-        else:
-            io.read_null(f)
+        tail = SkeletalLOD5.WEIGHT_VB_TAIL + bytes(16 if version >= '5.0' else 4)
+        io.check(f.read(len(tail)), tail, f)
+        if version < '5.0':
             self.adjacency_vb = SkeletalIndexBuffer.read(f, name='Adjacency_VB')
-            io.read_null(f)
-            io.read_null(f)
+            io.read_null_array(f, 2)
         io.check(f.tell() - buffer_block_start_offset, buffer_block_size)
 
     @staticmethod
     def write(f, lod):
         """Write function."""
-        io.write_uint16(f, 1)
-        io.write_uint32(f, 0)
-        io.write_uint32(f, 1)
+        f.write(SkeletalLOD5.HEADER)
         io.write_uint16_array(f, lod.active_bone_ids, with_length=True)
         io.write_array(f, lod.sections, SkeletalLODSection5.write, with_length=True)
         io.write_uint16_array(f, lod.required_bone_ids, with_length=True)
-        f.seek(4, 1)
+        io.write_uint32(f, 0)  # buffer_block_size (overwritten after writing the block)
         buffer_block_start_offset = f.tell()
         io.write_uint16(f, 1)
         SkeletalIndexBuffer.write(f, lod.ib)
         PositionVertexBuffer.write(f, lod.vb)
 
-        io.write_uint16(f, 1)
-        io.write_uint32(f, lod.uv_vb.uv_num)
-        io.write_uint32(f, lod.vb.vertex_num)
-        io.write_uint32(f, lod.uv_vb.use_float32UV)
-        io.write_null(f)
+        f.write(UVVertexBuffer.VERTEX_HEADER.pack(1, lod.uv_vb.uv_num, lod.vb.vertex_num, lod.uv_vb.use_float32UV, 0))
         NormalVertexBuffer.write(f, lod.normal_vb)
         UVVertexBuffer.write(f, lod.uv_vb)
         SkinWeightVertexBuffer5.write(f, lod.weight_vb)
-        io.write_uint16(f, 1)
-        io.write_null(f)
-        io.write_uint32(f, 4)
-        if lod.version >= '5.0':
-            io.write_null_array(f, 4)
-        else:
-            io.write_null(f)
+        f.write(SkeletalLOD5.WEIGHT_VB_TAIL + bytes(16 if lod.version >= '5.0' else 4))
+        if lod.version < '5.0':
             SkeletalIndexBuffer.write(f, lod.adjacency_vb)
-            io.write_null(f)
-            io.write_null(f)
+            io.write_null_array(f, 2)
 
         end_offset = f.tell()
         buffer_block_size = end_offset - buffer_block_start_offset
@@ -539,15 +565,12 @@ class SkeletalLOD5(SkeletalLOD):
         texcoords = self.uv_vb.parse()
 
         joint, weight = self.weight_vb.parse()
-        first_vertex_ids = [section.first_vertex_id for section in self.sections]
+        first_vertex_ids = self.first_vertex_ids
         vertex_groups = [section.vertex_group for section in self.sections]
 
         ary = [normal, pos, joint, weight]
         normals, positions, joints, weights = [split_list(elem, first_vertex_ids) for elem in ary]
-        texcoords = [split_list(tc, first_vertex_ids) for tc in texcoords]
+        texcoords = split_texcoords(texcoords, first_vertex_ids)
 
-        indices = self.ib.parse()
-        first_ib_ids = [section.first_ib_id for section in self.sections]
-        indices = split_list(indices, first_ib_ids)
-        indices = [[i - first_id for i in ids] for ids, first_id in zip(indices, first_vertex_ids)]
+        indices = self.parse_indices()
         return normals, positions, texcoords, vertex_groups, joints, weights, indices
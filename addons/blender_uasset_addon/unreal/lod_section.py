@@ -1,4 +1,6 @@
 """Classes for LOD sections."""
+import struct
+import numpy as np
 from ..util import io_util as io
 
 
@@ -15,50 +17,67 @@ class LODSection:
 
 class StaticLODSection(LODSection):
     """LOD section for static mesh."""
-    def __init__(self, f, version):
-        """Read function."""
+    # material_id, first_ib_id, face_num, first_vertex_id, last_vertex_id, enable_collision, cast_shadow
+    STRUCT = struct.Struct('<7I')
+    # ..., ForceOpaque?, VisibleInRayTracing?
+    STRUCT_4_27 = struct.Struct('<9I')
+
+    def __init__(self, version, material_id, first_ib_id, face_num, first_vertex_id,
+                 last_vertex_id, enable_collision, cast_shadow, unk=None, unk2=None):
+        """Constructor."""
         self.version = version
-        self.material_id = io.read_uint32(f)
-        self.first_ib_id = io.read_uint32(f)
-        self.face_num = io.read_uint32(f)
-        self.first_vertex_id = io.read_uint32(f)
-        self.last_vertex_id = io.read_uint32(f)
-        self.enable_collision = io.read_uint32(f)
-        self.cast_shadow = io.read_uint32(f)
+        self.material_id = material_id
+        self.first_ib_id = first_ib_id
+        self.face_num = face_num
+        self.first_vertex_id = first_vertex_id
+        self.last_vertex_id = last_vertex_id
+        self.enable_collision = enable_collision
+        self.cast_shadow = cast_shadow
+        if version >= '4.27':
+            self.unk = unk
+            self.unk2 = unk2
+
+    @staticmethod
+    def get_struct(version):
+        """Get binary layout of a section."""
         if version >= '4.27':
-            self.unk = io.read_uint32(f)  # ForceOpaque?
-            self.unk2 = io.read_uint32(f)  # VisibleInRayTracing?
+            return StaticLODSection.STRUCT_4_27
+        return StaticLODSection.STRUCT
 
     @staticmethod
     def read(f, version):
         """Read function."""
-        return StaticLODSection(f, version)
+        st = StaticLODSection.get_struct(version)
+        return StaticLODSection(version, *st.unpack(f.read(st.size)))
+
+    @staticmethod
+    def read_array(f, version):
+        """Read an array of sections with one read call."""
+        st = StaticLODSection.get_struct(version)
+        num = io.read_uint32(f)
+        return [StaticLODSection(version, *fields) for fields in st.iter_unpack(f.read(st.size * num))]
 
     @staticmethod
     def write(f, section):
         """Write function."""
-        io.write_uint32(f, section.material_id)
-        io.write_uint32(f, section.first_ib_id)
-        io.write_uint32(f, section.face_num)
-        io.write_uint32(f, section.first_vertex_id)
-        io.write_uint32(f, section.last_vertex_id)
-        io.write_uint32(f, section.enable_collision)
-        io.write_uint32(f, section.cast_shadow)
+        fields = (section.material_id, section.first_ib_id, section.face_num,
+                  section.first_vertex_id, section.last_vertex_id,
+                  section.enable_collision, section.cast_shadow)
         if section.version >= '4.27':
-            io.write_uint32(f, section.unk)
-            io.write_uint32(f, section.unk2)
+            fields += (section.unk, section.unk2)
+        f.write(StaticLODSection.get_struct(section.version).pack(*fields))
 
     def print(self, i, padding=2):
         """Print meta data."""
         pad = ' ' * padding
-        print(pad + f'section{i}')
-        print(pad + f'  material_id: {self.material_id}')
-        print(pad + f'  first_ib_id: {self.first_ib_id}')
-        print(pad + f'  face_num: {self.face_num}')
-        print(pad + f'  first_vertex_id: {self.first_vertex_id}')
-        print(pad + f'  last_vertex_id: {self.last_vertex_id}')
-        print(pad + f'  enable_collision: {self.enable_collision > 0}')
-        print(pad + f'  cast_shadow: {self.cast_shadow > 0}')
+        print('\n'.join([pad + f'section{i}',
+                         pad + f'  material_id: {self.material_id}',
+                         pad + f'  first_ib_id: {self.first_ib_id}',
+                         pad + f'  face_num: {self.face_num}',
+                         pad + f'  first_vertex_id: {self.first_vertex_id}',
+                         pad + f'  last_vertex_id: {self.last_vertex_id}',
+                         pad + f'  enable_collision: {self.enable_collision > 0}',
+                         pad + f'  cast_shadow: {self.cast_shadow > 0}']))
 
     def import_from_blender(self, material_id, first_vertex_id, vert_num, first_ib_id, face_num):
         """Import section data from Blender."""
@@ -74,7 +93,7 @@ class SkeletalLODSection(LODSection):
     def remove_KDI(self):
         """Disable KDI."""
         self.unk1 = 0
-        self.unk2 = []
+        self.unk2 = b''
 
     @staticmethod
     def bone_ids_to_name(bone_ids, bones):
@@ -96,6 +115,12 @@ class SkeletalLODSection4(SkeletalLODSection):
     # vertex_group: Id of weight painted bones. Bone influences are specified by vertex_group's id (not bone id).
     # vertex_num: the number of vertices in this section
     CorrespondClothAssetIndex = b'\xCD\xCD'
+    # 1, material_id, first_ib_id, face_num, null, b'\x00\xff\xff', unk,
+    # recompute_tangent, cast_shadow, first_vertex_id
+    STRUCT = struct.Struct('<HHIII3s1sIII')
+    # vertex_num, max_bone_influences, null, CorrespondClothAssetIndex,
+    # AssetGuid (null), AssetLodIndex (-1)
+    TAIL = struct.Struct('<II12s2s16si')
 
     def __init__(self, version, material_id, first_ib_id, face_num, unk,
                  recompute_tangent, cast_shadow,
@@ -119,35 +144,27 @@ class SkeletalLODSection4(SkeletalLODSection):
     @staticmethod
     def read(f, version):
         """Read function."""
-        io.check(io.read_uint16(f), 1, f)
-        material_id = io.read_uint16(f)
-        first_ib_id = io.read_uint32(f)
-        face_num = io.read_uint32(f)
-        io.read_null(f)
-        io.check(f.read(3), b'\x00\xff\xff')
-        unk = f.read(1)
-        recompute_tangent = io.read_uint32(f)
-        cast_shadow = io.read_uint32(f)
-        first_vertex_id = io.read_uint32(f)
-
-        vertex_group = io.read_uint16_array(f)
-
-        vertex_num = io.read_uint32(f)
-
-        max_bone_influences = io.read_uint32(f)
-
-        io.read_null_array(f, 3)
-        cloth_asset_index = f.read(2)
+        (one, material_id, first_ib_id, face_num, null, ffff, unk,
+         recompute_tangent, cast_shadow, first_vertex_id) = \
+            SkeletalLODSection4.STRUCT.unpack(f.read(SkeletalLODSection4.STRUCT.size))
+        io.check(one, 1, f)
+        io.check(null, 0, f, 'Not NULL!')
+        io.check(ffff, b'\x00\xff\xff')
+
+        vertex_group = np.frombuffer(f.read(io.read_uint32(f) * 2), dtype='<u2')
+
+        (vertex_num, max_bone_influences, null, cloth_asset_index, guid, asset_lod_index) = \
+            SkeletalLODSection4.TAIL.unpack(f.read(SkeletalLODSection4.TAIL.size))
+        io.check(null, bytes(12), f, 'Not NULL!')
         io.check(cloth_asset_index, SkeletalLODSection4.CorrespondClothAssetIndex, f,
                  'Parse failed! (LOD_Section:CorrespondClothAssetIndex)')
-        io.read_null_array(f, 4, 'LOD_Section:ClothingSectionData: GUID should be null.')
-        unknown = io.read_int32(f)
-        io.check(unknown, -1, f, 'LOD_Section:ClothingSectionData: AssetLodIndex should be -1.')
+        io.check(guid, bytes(16), f, 'LOD_Section:ClothingSectionData: GUID should be null.')
+        io.check(asset_lod_index, -1, f, 'LOD_Section:ClothingSectionData: AssetLodIndex should be -1.')
         if version in ['ff7r', 'kh3']:
             unk1 = io.read_uint32(f)
             num = io.read_uint32(f)
             io.check(unk1 == 1, num > 0, f)
-            unk2 = io.read_uint8_array(f, length=num * 16)
+            unk2 = f.read(num * 16)
         else:
             unk1 = None
             unk2 = None
@@ -157,55 +174,37 @@ class SkeletalLODSection4(SkeletalLODSection):
                                       unk1, unk2)
         return section
 
-    def copy(self):
-        """Copy itself."""
-        return SkeletalLODSection4(self.version, self.material_id,
-                                   self.first_ib_id, self.face_num, self.unk,
-                                   self.recompute_tangent, self.cast_shadow,
-                                   self.first_vertex_id, self.vertex_group,
-                                   self.vertex_num, self.max_bone_influences,
-                                   0, [])
-
     @staticmethod
     def write(f, section):
         """Write function."""
-        io.write_uint16(f, 1)
-        io.write_uint16(f, section.material_id)
-        io.write_uint32(f, section.first_ib_id)
-        io.write_uint32(f, section.face_num)
-        io.write_null(f)
-        f.write(b'\x00\xff\xff')
-        f.write(section.unk)
-        io.write_uint32(f, section.recompute_tangent)
-        io.write_uint32(f, section.cast_shadow)
-        io.write_uint32(f, section.first_vertex_id)
+        f.write(SkeletalLODSection4.STRUCT.pack(1, section.material_id, section.first_ib_id, section.face_num,
+                                                0, b'\x00\xff\xff', section.unk,
+                                                section.recompute_tangent, section.cast_shadow,
+                                                section.first_vertex_id))
         io.write_uint16_array(f, section.vertex_group, with_length=True)
-        io.write_uint32(f, section.vertex_num)
-        io.write_uint32(f, section.max_bone_influences)
-        io.write_null_array(f, 3)
-        f.write(SkeletalLODSection4.CorrespondClothAssetIndex)
-        io.write_null_array(f, 4)
-        io.write_int32(f, -1)
+        f.write(SkeletalLODSection4.TAIL.pack(section.vertex_num, section.max_bone_influences, bytes(12),
+                                              SkeletalLODSection4.CorrespondClothAssetIndex, bytes(16), -1))
         if section.version in ['ff7r', 'kh3']:
             io.write_uint32(f, section.unk1)
             io.write_uint32(f, len(section.unk2) // 16)
-            io.write_uint8_array(f, section.unk2)
+            f.write(section.unk2)
 
     def print(self, name, bones, padding=2):
         """Print meta data."""
         pad = ' ' * padding
-        print(pad + 'section ' + name)
-        print(pad + f'  material_id: {self.material_id}')
-        print(pad + f'  first_ib_id: {self.first_ib_id}')
-        print(pad + f'  face_num: {self.face_num}')
-        print(pad + f'  first_vertex_id: {self.first_vertex_id}')
         vg_name = SkeletalLODSection.bone_ids_to_name(self.vertex_group, bones)
-        print(pad + f'  vertex_group: {vg_name}')
-        print(pad + f'  vertex_num: {self.vertex_num}')
-        print(pad + f'  max bone influences: {self.max_bone_influences}')
+        lines = [pad + 'section ' + name,
+                 pad + f'  material_id: {self.material_id}',
+                 pad + f'  first_ib_id: {self.first_ib_id}',
+                 pad + f'  face_num: {self.face_num}',
+                 pad + f'  first_vertex_id: {self.first_vertex_id}',
+                 pad + f'  vertex_group: {vg_name}',
+                 pad + f'  vertex_num: {self.vertex_num}',
+                 pad + f'  max bone influences: {self.max_bone_influences}']
         if self.unk2 is not None:
-            print(pad + f'  KDI flag: {self.unk1 > 0}')
-            print(pad + f'  vertices influenced by KDI: {len(self.unk2) // 16}')
+            lines += [pad + f'  KDI flag: {self.unk1 > 0}',
+                      pad + f'  vertices influenced by KDI: {len(self.unk2) // 16}']
+        print('\n'.join(lines))
 
     def import_from_blender(self, vertex_group, material_id, first_vertex_id, vertex_num,
                             first_ib_id, face_num, max_bone_influences):
@@ -223,6 +222,13 @@ class SkeletalLODSection4(SkeletalLODSection):
 
 class SkeletalLODSection5(LODSection):
     """LOD section for UE5 skeletal mesh (FSkelMeshSection)."""
+    # 1, material_id, first_ib_id, face_num, unk, cast_shadow, first_vertex_id
+    STRUCT = struct.Struct('<HHIQBIQ')
+    # 1, material_id, first_ib_id, face_num, unk, cast_shadow, ray_tracing, first_vertex_id
+    STRUCT_5_0 = struct.Struct('<HHIQBIIQ')
+    # vertex_num, max_bone_influences, CorrespondClothAssetIndex?,
+    # AssetGuid for FClothingSectionData? (null), AssetLodIndex for FClothingSectionData? (-1)
+    TAIL = struct.Struct('<II2s16si')
 
     def __init__(self, version, material_id, first_ib_id, face_num, unk,
                  first_vertex_id, vertex_group, vertex_num, max_bone_influences,
@@ -245,24 +251,21 @@ class SkeletalLODSection5(LODSection):
     @staticmethod
     def read(f, version):
         """Read function."""
-        io.check(io.read_uint16(f), 1)
-        material_id = io.read_uint16(f)
-        first_ib_id = io.read_uint32(f)
-        face_num = io.read_uint64(f)
-        unk = io.read_uint8(f)
-        cast_shadow = io.read_uint32(f)
         if version >= '5.0':
-            ray_tracing = io.read_uint32(f)
+            (one, material_id, first_ib_id, face_num, unk, cast_shadow, ray_tracing, first_vertex_id) = \
+                SkeletalLODSection5.STRUCT_5_0.unpack(f.read(SkeletalLODSection5.STRUCT_5_0.size))
         else:
+            (one, material_id, first_ib_id, face_num, unk, cast_shadow, first_vertex_id) = \
+                SkeletalLODSection5.STRUCT.unpack(f.read(SkeletalLODSection5.STRUCT.size))
             ray_tracing = None
-        first_vertex_id = io.read_uint64(f)
-        vertex_group = io.read_uint16_array(f)
-        vertex_num = io.read_uint32(f)
-        max_bone_influences = io.read_uint32(f)
-        io.check(f.read(2), b'\xff\xff')  # CorrespondClothAssetIndex?
-        io.read_null_array(f, 4)  # AssetGuid for FClothingSectionData?
-        io.check(io.read_int32(f), -1)  # AssetLodIndex for FClothingSectionData?
-        unk_ids = io.read_uint32_array(f)
+        io.check(one, 1)
+        vertex_group = np.frombuffer(f.read(io.read_uint32(f) * 2), dtype='<u2')
+        (vertex_num, max_bone_influences, cloth_asset_index, guid, asset_lod_index) = \
+            SkeletalLODSection5.TAIL.unpack(f.read(SkeletalLODSection5.TAIL.size))
+        io.check(cloth_asset_index, b'\xff\xff')
+        io.check(guid, bytes(16))
+        io.check(asset_lod_index, -1)
+        unk_ids = np.frombuffer(f.read(io.read_uint32(f) * 4), dtype='<u4')
         io.read_const_uint32(f, vertex_num)
         unk_ids2 = f.read(vertex_num * 8)
         io.read_null(f)
@@ -271,33 +274,20 @@ class SkeletalLODSection5(LODSection):
                                       unk_ids, unk_ids2, cast_shadow, ray_tracing)
         return section
 
-    def copy(self):
-        """Copy itself."""
-        return SkeletalLODSection5(self.version, self.material_id,
-                                   self.first_ib_id, self.face_num, self.unk,
-                                   self.first_vertex_id, self.vertex_group, self.vertex_num,
-                                   self.max_bone_influences,
-                                   self.unk_ids, self.unk_ids2, self.cast_shadow, self.ray_tracing)
-
     @staticmethod
     def write(f, section):
         """Write function."""
-        io.write_uint16(f, 1)
-        io.write_uint16(f, section.material_id)
-        io.write_uint32(f, section.first_ib_id)
-        io.write_uint64(f, section.face_num)
-        io.write_uint8(f, section.unk)
-        io.write_uint32(f, section.cast_shadow)
         if section.version >= '5.0':
-            io.write_uint32(f, section.ray_tracing)
-        io.write_uint64(f, section.first_vertex_id)
+            f.write(SkeletalLODSection5.STRUCT_5_0.pack(1, section.material_id, section.first_ib_id,
+                                                        section.face_num, section.unk, section.cast_shadow,
+                                                        section.ray_tracing, section.first_vertex_id))
+        else:
+            f.write(SkeletalLODSection5.STRUCT.pack(1, section.material_id, section.first_ib_id,
+                                                    section.face_num, section.unk, section.cast_shadow,
+                                                    section.first_vertex_id))
         io.write_uint16_array(f, section.vertex_group, with_length=True)
-        io.write_uint32(f, section.vertex_num)
-        io.write_uint32(f, section.max_bone_influences)
-
-        f.write(b'\xff\xff')
-        io.write_null_array(f, 4)
-        io.write_int32(f, -1)
+        f.write(SkeletalLODSection5.TAIL.pack(section.vertex_num, section.max_bone_influences,
+                                              b'\xff\xff', bytes(16), -1))
         io.write_uint32_array(f, section.unk_ids, with_length=True)
         io.write_uint32(f, section.vertex_num)
         f.write(section.unk_ids2)
@@ -306,18 +296,19 @@ class SkeletalLODSection5(LODSection):
     def print(self, name, bones, padding=2):
         """Print meta data."""
         pad = ' ' * padding
-        print(pad + 'section ' + name)
-        print(pad + f'  material_id: {self.material_id}')
-        print(pad + f'  first_ib_id: {self.first_ib_id}')
-        print(pad + f'  face_num: {self.face_num}')
-        print(pad + f'  first_vertex_id: {self.first_vertex_id}')
         vg_name = SkeletalLODSection.bone_ids_to_name(self.vertex_group, bones)
-        print(pad + f'  vertex_group: {vg_name}')
-        print(pad + f'  vertex_num: {self.vertex_num}')
-        print(pad + f'  max bone influences: {self.max_bone_influences}')
-        print(pad + f'  cast_shadow: {self.cast_shadow}')
+        lines = [pad + 'section ' + name,
+                 pad + f'  material_id: {self.material_id}',
+                 pad + f'  first_ib_id: {self.first_ib_id}',
+                 pad + f'  face_num: {self.face_num}',
+                 pad + f'  first_vertex_id: {self.first_vertex_id}',
+                 pad + f'  vertex_group: {vg_name}',
+                 pad + f'  vertex_num: {self.vertex_num}',
+                 pad + f'  max bone influences: {self.max_bone_influences}',
+                 pad + f'  cast_shadow: {self.cast_shadow}']
         if self.ray_tracing is not None:
-            print(pad + f'  ray_tracing: {self.ray_tracing}')
+            lines.append(pad + f'  ray_tracing: {self.ray_tracing}')
+        print('\n'.join(lines))
 
     def import_from_blender(self, vertex_group, material_id, first_vertex_id,
                             vertex_num, first_ib_id, face_num, max_bone_influences):
@@ -60,68 +60,68 @@ class Material:
     def print(self, padding=2):
         """Print meta data."""
         pad = ' ' * padding
-        print(pad + self.import_name)
-        print(pad + f'  slot name: {self.slot_name}')
-        print(pad + f'  asset path: {self.asset_path}')
+        print('\n'.join([pad + self.import_name,
+                         pad + f'  slot name: {self.slot_name}',
+                         pad + f'  asset path: {self.asset_path}']))
 
     @staticmethod
     def assign_materials(materials1, materials2):
         """Assign material ids."""
         print('Assigning materials...')
 
-        def get_range(num):
-            return list(range(num))
-
-        new_material_ids = get_range(len(materials2))
+        new_material_ids = list(range(len(materials2)))
 
         slot_names1 = [m.slot_name for m in materials1]
         slot_names2 = [m.slot_name for m in materials2]
         assigned1 = [False] * len(materials1)
         assigned2 = [False] * len(materials2)
 
-        def assign(names1, names2, assigned1, assigned2, new_material_ids):
-            for i, name in zip(range(len(materials2)), names2):
+        def get_name_to_id(names):
+            # the first id of each name (same as names.index(name))
+            name_to_id = {}
+            for j, name in enumerate(names):
+                name_to_id.setdefault(name, j)
+            return name_to_id
+
+        def assign(name_to_id, names2, assigned1, assigned2, new_material_ids):
+            for i, name in enumerate(names2):
                 if assigned2[i]:
                     continue
-                if name in names1:
-                    new_id = names1.index(name)
-                    if not assigned1[new_id]:
-                        new_material_ids[i] = new_id
-                        assigned2[i] = True
-                        assigned1[new_id] = True
+                new_id = name_to_id.get(name)
+                if new_id is not None and not assigned1[new_id]:
+                    new_material_ids[i] = new_id
+                    assigned2[i] = True
+                    assigned1[new_id] = True
             return new_material_ids, assigned1, assigned2
 
         # assign to the materials have same slot names
-        new_material_ids, assigned1, assigned2 = assign(slot_names1, slot_names2, assigned1,
+        new_material_ids, assigned1, assigned2 = assign(get_name_to_id(slot_names1), slot_names2, assigned1,
                                                         assigned2, new_material_ids)
 
-        names1 = [m.import_name for m in materials1]
+        name_to_id1 = get_name_to_id([m.import_name for m in materials1])
         names2 = [m.import_name for m in materials2]
         # assign to the materials have same material names
-        new_material_ids, assigned1, assigned2 = assign(names1, names2, assigned1,
+        new_material_ids, assigned1, assigned2 = assign(name_to_id1, names2, assigned1,
                                                         assigned2, new_material_ids)
 
         def remove_suffix(s):
-            if s[-4] == '.':
+            if s[-4:-3] == '.':
                 return s[:-4]
             return s
 
         # Remove suffix (.xxx) from material names
-        names2 = [remove_suffix(n) for n in names2]
+        suffixless_names2 = [remove_suffix(n) for n in names2]
         # compare the names again
-        new_material_ids, assigned1, assigned2 = assign(names1, names2, assigned1, assigned2,
+        new_material_ids, assigned1, assigned2 = assign(name_to_id1, suffixless_names2, assigned1, assigned2,
                                                         new_material_ids)
 
-        def index_of(val, in_list):
-            try:
-                return in_list.index(val)
-            except ValueError:
-                return None
+        # unassigned slots in ascending order (same order as assigned1.index(False))
+        free_ids = iter([j for j, assigned in enumerate(assigned1) if not assigned])
 
-        for i in range(len(materials2)):
-            if not assigned2[i]:
+        for i, assigned in enumerate(assigned2):
+            if not assigned:
                 assigned2[i] = True
-                new_id = index_of(False, assigned1)
+                new_id = next(free_ids, None)
                 if new_id is not None:
                     assigned1[new_id] = True
                 else:
@@ -129,9 +129,10 @@ class Material:
                     assigned1.append(True)
                 new_material_ids[i] = new_id
 
-        for i, mat2 in zip(range(len(materials2)), materials2):
+        material_num1 = len(materials1)
+        for i, mat2 in enumerate(materials2):
             m2str = mat2.import_name
-            if i < len(materials1):
+            if i < material_num1:
                 mat1 = materials1[new_material_ids[i]]
                 m1str = mat1.import_name
                 if m1str != mat1.slot_name:
@@ -142,18 +143,33 @@ class Material:
 
         return new_material_ids
 
-    def load_asset(self, main_file_path, main_asset_path, version):
-        """Load material assets and store texture paths."""
+    def load_asset(self, main_file_path, main_asset_path, version, asset_cache=None):
+        """Load material assets and store texture paths.
+
+        Notes:
+            asset_cache is a dict to share loaded texture paths between materials.
+            Each material asset will be parsed only once if you pass the same dict.
+        """
         if self.asset_path == 'None':
-            return self.asset_path
+            return
+
+        main_asset_dir = os.path.dirname(main_asset_path)
+        main_file_dir = os.path.dirname(main_file_path)
+        actual_dirs = {}  # asset dir -> actual dir
 
         def get_actual_path(target_asset_path):
-            main_asset_dir = os.path.dirname(main_asset_path)
-            rel_path = os.path.relpath(os.path.dirname(target_asset_path), start=main_asset_dir)
-            base = os.path.basename(target_asset_path) + '.uasset'
-            return os.path.normpath(os.path.join(os.path.dirname(main_file_path), rel_path, base))
+            target_asset_dir, base = os.path.split(target_asset_path)
+            if target_asset_dir not in actual_dirs:
+                rel_path = os.path.relpath(target_asset_dir, start=main_asset_dir)
+                actual_dirs[target_asset_dir] = os.path.join(main_file_dir, rel_path)
+            return os.path.normpath(os.path.join(actual_dirs[target_asset_dir], base + '.uasset'))
 
         file_path = get_actual_path(self.asset_path)
+        if asset_cache is not None and file_path in asset_cache:
+            texture_asset_paths, texture_actual_paths = asset_cache[file_path]
+            self.texture_asset_paths = list(texture_asset_paths)
+            self.texture_actual_paths = list(texture_actual_paths)
+            return
         if os.path.exists(file_path):
             try:
                 material_asset = uasset.Uasset(file_path, ignore_uexp=True, version=str(version),
@@ -171,3 +187,5 @@ class Material:
             print(m)
             self.texture_asset_paths = [m]
             self.texture_actual_paths = []
+        if asset_cache is not None:
+            asset_cache[file_path] = (tuple(self.texture_asset_paths), tuple(self.texture_actual_paths))
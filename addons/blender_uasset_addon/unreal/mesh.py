@@ -1,7 +1,7 @@
 """Classes for mesh."""
 import json
 import os
-import struct
+import numpy as np
 from ..util import io_util as io
 
 from .lod import StaticLOD, SkeletalLOD4, SkeletalLOD5
@@ -48,29 +48,20 @@ class Mesh:
     @staticmethod
     def seek_materials(f, imports, material_size):
         """Read binary data until find material import ids."""
-        has_material = False
-        for imp in imports:
-            if imp.material:
-                has_material = True
-        # offset = f.tell()
-        buf = f.read(3)
-        size = io.get_size(f)
+        is_material = [imp.material for imp in imports]
+        has_material = any(is_material)
         while True:
-            while buf != b'\xff' * 3:
-                if b'\xff' not in buf:
-                    buf = f.read(3)
-                else:
-                    buf = b''.join([buf[1:], f.read(1)])
-                if f.tell() == size:
-                    raise RuntimeError('Material properties not found. This is an unexpected error.')
-            f.seek(-4, 1)
+            # upper 3 bytes of a negative import id
+            offset = io.find_bytes(f, b'\xff' * 3)
+            if offset < 0:
+                raise RuntimeError('Material properties not found. This is an unexpected error.')
+            f.seek(offset - 1)
             import_id = -io.read_int32(f) - 1
-            if import_id < len(imports) and imports[import_id].material:
+            if import_id < len(is_material) and is_material[import_id]:
                 break
             if import_id == 0 and not has_material:
                 break
-            # print(imports[import_id].name)
-            buf = b''.join([buf[1:], f.read(1)])
+            f.seek(offset + 1)
         if has_material:
             f.seek(-8, 1)
         else:
@@ -130,7 +121,7 @@ class Mesh:
         # add import for material
         sample_material_import = imports[-import_id - 1]
         new_material_import = sample_material_import.copy()
-        imports.append(new_material_import)
+        uasset.add_import(new_material_import)
         new_material_import.parent_import_id = -len(imports) - 1
         new_material_import.name_id = len(name_list)
         name_list.append(import_name)
@@ -138,7 +129,7 @@ class Mesh:
         # add import for material dir
         sample_dir_import = imports[-sample_material_import.parent_import_id - 1]
         new_dir_import = sample_dir_import.copy()
-        imports.append(new_dir_import)
+        uasset.add_import(new_dir_import)
         new_dir_import.name_id = len(name_list)
         name_list.append(file_path)
 
@@ -181,10 +172,10 @@ class StaticMesh(Mesh):
         version = uasset.version
 
         offset = f.tell()
-        buf = f.read(6)
-        while buf != b'\x01\x00\x01\x00\x00\x00':
-            buf = b''.join([buf[1:], f.read(1)])
-        unk_size = f.tell() - offset + 28
+        lod_offset = io.find_bytes(f, b'\x01\x00\x01\x00\x00\x00')
+        if lod_offset < 0:
+            raise RuntimeError('LOD data not found. This is an unexpected error.')
+        unk_size = lod_offset - offset + 6 + 28
 
         f.seek(offset)
         unk = f.read(unk_size)
@@ -307,23 +298,27 @@ class ExtraMesh:
         I removed buffers from this mesh, but it won't affect physics
         (collision with other objects, and collision between body and cloth)
     """
+    # bone ids and weights for each vertex
+    WEIGHT_DTYPE = np.dtype([('bone_ids', '<u2', 4), ('weights', 'u1', 4)])
+
     def __init__(self, f, bones):
         """Read function."""
         self.offset = f.tell()
         self.names = [b.name for b in bones]
         vertex_num = io.read_uint32(f)
-        self.vb = f.read(vertex_num * 12)
+        self.vb = np.frombuffer(f.read(vertex_num * 12), dtype='<f4').reshape(vertex_num, 3)  # positions
         io.read_const_uint32(f, vertex_num)
-        self.weight_buffer = list(struct.unpack('<' + 'HHHHBBBB' * vertex_num, f.read(vertex_num * 12)))
+        self.weight_buffer = np.frombuffer(f.read(vertex_num * ExtraMesh.WEIGHT_DTYPE.itemsize),
+                                           dtype=ExtraMesh.WEIGHT_DTYPE)
         face_num = io.read_uint32(f)
-        self.ib = f.read(face_num * 6)
+        self.ib = np.frombuffer(f.read(face_num * 6), dtype='<u2').reshape(face_num, 3)  # vertex ids
         self.unk = f.read(8)
 
     def disable(self):
         """Remove mesh data."""
-        self.vb = b''
-        self.weight_buffer = b''
-        self.ib = b''
+        self.vb = np.empty((0, 3), dtype='<f4')
+        self.weight_buffer = np.empty(0, dtype=ExtraMesh.WEIGHT_DTYPE)
+        self.ib = np.empty((0, 3), dtype='<u2')
 
     @staticmethod
     def read(f, bones):
@@ -333,20 +328,18 @@ class ExtraMesh:
     @staticmethod
     def write(f, mesh):
         """Write function."""
-        vertex_num = len(mesh.vb) // 12
+        vertex_num = len(mesh.vb)
         io.write_uint32(f, vertex_num)
-        f.write(mesh.vb)
+        f.write(mesh.vb.tobytes())
         io.write_uint32(f, vertex_num)
-        f.write(struct.pack('<' + 'HHHHBBBB' * vertex_num, *mesh.weight_buffer))
-
-        # f.write(mesh.weight_buffer)
-        io.write_uint32(f, len(mesh.ib) // 6)
-        f.write(mesh.ib)
+        f.write(mesh.weight_buffer.tobytes())
+        io.write_uint32(f, len(mesh.ib))
+        f.write(mesh.ib.tobytes())
         f.write(mesh.unk)
 
     def print(self, padding=0):
         """Print meta data."""
         pad = ' ' * padding
         print(pad + f'Mesh (offset: {self.offset})')
-        print(pad + f'  vertex_num: {len(self.vb) // 12}')
-        print(pad + f'  face_num: {len(self.ib) // 6}')
+        print(pad + f'  vertex_num: {len(self.vb)}')
+        print(pad + f'  face_num: {len(self.ib)}')
@@ -153,6 +153,7 @@ class UassetImport(c.LittleEndianStructure):
         copied = UassetImport()
         copied.parent_dir_id = self.parent_dir_id
         copied.class_id = self.class_id
+        copied.class_name = self.class_name
         copied.parent_import_id = self.parent_import_id
         copied.name_id = self.name_id
         copied.unk = self.unk
@@ -173,6 +174,14 @@ def name_imports(imports, name_list):
     list(map(name_parent, imports))
 
 
+def group_imports_by_class(imports):
+    """Get a dictionary that maps class names to lists of (import, import id)."""
+    imports_by_class = {}
+    for i, imp in enumerate(imports):
+        imports_by_class.setdefault(imp.class_name, []).append((imp, i))
+    return imports_by_class
+
+
 class UassetExport(c.LittleEndianStructure):
     """Export data of .uasset."""
     _pack_ = 1
@@ -308,6 +317,7 @@ class Uasset:
             io.check(self.header.import_offset, f.tell(), f)
             self.imports = [UassetImport.read(f, self.version) for i in range(self.header.import_count)]
             name_imports(self.imports, self.name_list)
+            self.imports_by_class = group_imports_by_class(self.imports)
             if verbose:
                 print('Import')
                 list(map(lambda x, i: x.print(str(i)), self.imports, range(len(self.imports))))
@@ -351,6 +361,11 @@ class Uasset:
 
         self.uexp = Uexp(base + 'uexp', self, verbose=verbose)
 
+    def add_import(self, imp):
+        """Append an import and register it to imports_by_class."""
+        self.imports_by_class.setdefault(imp.class_name, []).append((imp, len(self.imports)))
+        self.imports.append(imp)
+
     def save(self, file):
         """Save an asset file."""
         ext = io.get_ext(file)
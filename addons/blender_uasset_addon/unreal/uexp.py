@@ -45,7 +45,7 @@ class Uexp:
         # open .uexp
         self.mesh = None
         self.skeleton = None
-        with open(file, 'rb') as f:
+        with io.MappedFile(file) as f:
             for export in self.exports:
                 if f.tell() + self.uasset.size != export.offset:
                     raise RuntimeError('Parse failed.')
@@ -84,8 +84,10 @@ class Uexp:
     def load_material_asset(self):
         """Load material files and store texture paths."""
         if self.mesh is not None:
+            asset_cache = {}
             for mat in self.mesh.materials:
-                mat.load_asset(self.uasset.actual_path, self.asset_path, version=self.version)
+                mat.load_asset(self.uasset.actual_path, self.asset_path, version=self.version,
+                               asset_cache=asset_cache)
 
     def save(self, file):
         """Save .uexp file."""
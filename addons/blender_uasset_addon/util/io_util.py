@@ -1,7 +1,11 @@
 """Utils for I/O."""
 
+import array
+import io
+import mmap
 import os
 import struct
+import sys
 import tempfile
 
 
@@ -35,6 +39,60 @@ def get_size(f):
     return size
 
 
+class MappedFile(io.RawIOBase):
+    """Read-only file object backed by mmap.
+
+    Notes:
+        read() returns copies of the mapped data, so the file is not locked after closing.
+        It has "name" attribute like file objects.
+    """
+
+    def __init__(self, file):
+        """Map a whole file."""
+        super().__init__()
+        with open(file, 'rb') as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.name = file
+
+    def readable(self):
+        """Return True."""
+        return True
+
+    def seekable(self):
+        """Return True."""
+        return True
+
+    def read(self, size=-1):
+        """Read binary data as bytes."""
+        return self.mm.read(size)
+
+    def readinto(self, b):
+        """Read binary data into a writable buffer."""
+        data = self.mm.read(memoryview(b).nbytes)
+        memoryview(b).cast('B')[:len(data)] = data
+        return len(data)
+
+    def peek(self, size=1):
+        """Read binary data without moving the file position."""
+        pos = self.mm.tell()
+        return self.mm[pos:pos + size]
+
+    def seek(self, offset, whence=0):
+        """Change the file position."""
+        self.mm.seek(offset, whence)
+        return self.mm.tell()
+
+    def tell(self):
+        """Get the file position."""
+        return self.mm.tell()
+
+    def close(self):
+        """Unmap the file."""
+        if not self.closed:
+            self.mm.close()
+        super().close()
+
+
 def check(actual, expected, f=None, msg='Parse failed. This is unexpected error.'):
     """Check if actual and expected is the same."""
     if actual != expected:
@@ -63,6 +121,17 @@ def read_uint8(file):
     return int(binary[0])
 
 
+def peek_uint8(file):
+    """Read 1-byte as uint without moving the file position."""
+    if isinstance(file, io.BytesIO):
+        return int(file.getbuffer()[file.tell()])
+    if hasattr(file, 'peek'):
+        return int(file.peek(1)[0])
+    num = read_uint8(file)
+    file.seek(-1, 1)
+    return num
+
+
 def read_int32(file):
     """Read 4-byte as int."""
     binary = file.read(4)
@@ -87,6 +156,32 @@ def read_float16(file):
     return struct.unpack('<e', binary)[0]
 
 
+def find_bytes(file, pattern, chunk_size=0x10000):
+    """Find binary data from the current position and return its offset.
+
+    Notes:
+        Returns -1 if the pattern is not found.
+        The file position will not be changed.
+    """
+    start = file.tell()
+    offset = start  # offset of buf
+    buf = b''
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            file.seek(start)
+            return -1
+        buf = b''.join([buf, chunk])
+        i = buf.find(pattern)
+        if i >= 0:
+            file.seek(start)
+            return offset + i
+        # keep the tail in case the pattern is split between chunks
+        tail_size = min(len(buf), len(pattern) - 1)
+        offset += len(buf) - tail_size
+        buf = buf[len(buf) - tail_size:]
+
+
 def read_array(file, read_func, length=None):
     """Read an array."""
     if length is None:
@@ -98,6 +193,10 @@ def read_array(file, read_func, length=None):
 st_list = ['b', 'B', 'h', 'H', 'i', 'I', 'l', 'L', 'e', 'f', 'd']
 st_size = [1, 1, 2, 2, 4, 4, 8, 8, 2, 4, 8]
 
+# typecodes that array.array can pack with the same item size as struct's standard sizes
+array_typecodes = [st for st in st_list
+                   if st in array.typecodes and array.array(st).itemsize == struct.calcsize('<' + st)]
+
 
 def read_num_array(file, structure, length=None):
     """Read an array of numbers."""
@@ -106,7 +205,12 @@ def read_num_array(file, structure, length=None):
     if length is None:
         length = read_uint32(file)
     binary = file.read(st_size[st_list.index(structure)] * length)
-    return list(struct.unpack('<' + structure * length, binary))
+    if structure in array_typecodes:
+        ary = array.array(structure, binary)
+        if sys.byteorder == 'big':
+            ary.byteswap()
+        return ary.tolist()
+    return list(struct.unpack(f'<{length}{structure}', binary))
 
 
 def read_uint32_array(file, length=None):
@@ -263,39 +367,83 @@ def write_array(file, ary, write_func, with_length=False):
         write_func(file, a)
 
 
+def check_int_range(ary, structure):
+    """Raise an error if a numpy array can not be stored as the integer type without wrapping.
+
+    Notes:
+        array.array and struct.pack raise errors for such values,
+        but ndarray.astype silently wraps them around.
+    """
+    if structure.lower() not in 'bhil':
+        return
+    signed = structure.islower()
+    size = st_size[st_list.index(structure)]
+    kind = ary.dtype.kind
+    if kind not in 'biu':
+        raise TypeError(f'Integer array expected for "{structure}". (dtype: {ary.dtype})')
+    if kind == 'b' or (kind == ('i' if signed else 'u') and ary.dtype.itemsize <= size):
+        return
+    if ary.size == 0:
+        return
+    bits = size * 8
+    low, high = (-(1 << (bits - 1)), (1 << (bits - 1)) - 1) if signed else (0, (1 << bits) - 1)
+    if ary.min() < low or ary.max() > high:
+        raise OverflowError(f'Values are out of range for "{structure}". ({ary.min()} ~ {ary.max()})')
+
+
+def write_num_array(file, ary, structure, with_length=False):
+    """Write an array of numbers."""
+    if structure not in st_list:
+        raise RuntimeError(f'Structure not found. {structure}')
+    length = len(ary)
+    if structure in array_typecodes and hasattr(ary, 'dtype'):  # numpy array
+        check_int_range(ary, structure)
+        binary = ary.astype('<' + structure, copy=False).tobytes()
+    elif structure in array_typecodes:
+        binary = array.array(structure, ary)
+        if sys.byteorder == 'big':
+            binary.byteswap()
+        binary = binary.tobytes()
+    else:
+        binary = struct.pack(f'<{length}{structure}', *ary)
+    if with_length:
+        binary = struct.pack('<I', length) + binary
+    file.write(binary)
+
+
 def write_uint32_array(file, ary, with_length=False):
     """Write an array of uint32."""
-    write_array(file, ary, write_uint32, with_length=with_length)
+    write_num_array(file, ary, 'I', with_length=with_length)
 
 
 def write_uint16_array(file, ary, with_length=False):
     """Write an array of uint16."""
-    write_array(file, ary, write_uint16, with_length=with_length)
+    write_num_array(file, ary, 'H', with_length=with_length)
 
 
 def write_uint8_array(file, ary, with_length=False):
     """Write an array of uint8."""
-    write_array(file, ary, write_uint8, with_length=with_length)
+    write_num_array(file, ary, 'B', with_length=with_length)
 
 
 def write_int32_array(file, ary, with_length=False):
     """Write an array of int32."""
-    write_array(file, ary, write_int32, with_length=with_length)
+    write_num_array(file, ary, 'i', with_length=with_length)
 
 
 def write_float64_array(file, ary, with_length=False):
     """Write an array of float64."""
-    write_array(file, ary, write_float64, with_length=with_length)
+    write_num_array(file, ary, 'd', with_length=with_length)
 
 
 def write_float32_array(file, ary, with_length=False):
     """Write an array of float32."""
-    write_array(file, ary, write_float32, with_length=with_length)
+    write_num_array(file, ary, 'f', with_length=with_length)
 
 
 def write_float16_array(file, ary, with_length=False):
     """Write an array of float32."""
-    write_array(file, ary, write_float16, with_length=with_length)
+    write_num_array(file, ary, 'e', with_length=with_length)
 
 
 def write_vec3_f32(file, vec3):
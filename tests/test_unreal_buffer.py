@@ -0,0 +1,324 @@
+"""Round-trip tests for buffers and LOD sections in unreal/*.py.
+
+Notes:
+    These tests use hand-made binary data, so they don't need sample assets.
+    Each test reads known bytes, parses them, imports the parsed data again,
+    and checks if the written data is the same as the original bytes.
+"""
+import io as pyio
+import struct
+
+import numpy as np
+import pytest
+
+from blender_uasset_addon.util.version import VersionInfo
+from blender_uasset_addon.unreal.buffer import (ColorVertexBuffer,
+                                                StaticMeshVertexBuffer,
+                                                SkeletalMeshVertexBuffer,
+                                                SkinWeightVertexBuffer4,
+                                                SkinWeightVertexBuffer5,
+                                                StaticIndexBuffer,
+                                                SkeletalIndexBuffer)
+from blender_uasset_addon.unreal.lod_section import (StaticLODSection,
+                                                     SkeletalLODSection4,
+                                                     SkeletalLODSection5)
+
+
+def make_version(version):
+    """Get VersionInfo in the same way as Uasset."""
+    custom_versions = {'ff7r': '4.18', 'kh3': '4.17'}
+    if version in custom_versions:
+        return VersionInfo(custom_versions[version], customized_version=version)
+    return VersionInfo(version)
+
+
+def write_bytes(write, obj):
+    """Get binary data written by a write function."""
+    f = pyio.BytesIO()
+    write(f, obj)
+    return f.getvalue()
+
+
+def make_normals(vertex_num):
+    """Get tangents and normals as a (vertex_num, 8) array."""
+    return (np.arange(vertex_num * 8).reshape(vertex_num, 8) * 7 % 256).astype(np.uint8)
+
+
+def make_texcoords(uv_num, vertex_num):
+    """Get UV maps that float16 can represent exactly."""
+    return np.arange(uv_num * vertex_num * 2).reshape(uv_num, vertex_num, 2) * 0.25 - 1
+
+
+def pack_texcoords(texcoords, i, use_float32):
+    """Get binary data of UV maps for a vertex."""
+    uv = texcoords[:, i].flatten()
+    return struct.pack('<' + ('f' if use_float32 else 'e') * len(uv), *uv)
+
+
+def color_vb_bytes(colors):
+    """Get binary data of ColorVertexBuffer."""
+    vertex_num = len(colors)
+    data = bytes(np.asarray(colors, dtype=np.uint8))
+    return struct.pack('<HII', 1, 4, vertex_num) + struct.pack('<II', 4, vertex_num) + data
+
+
+def test_color_vb_round_trip():
+    """Test ColorVertexBuffer with known bytes."""
+    colors = [[255, 0, 0, 255], [0, 255, 0, 128], [1, 2, 3, 4]]
+    data = color_vb_bytes(colors)
+    vb = ColorVertexBuffer.read(pyio.BytesIO(data))
+    parsed = vb.parse()
+    assert parsed.shape == (3, 4)
+    assert parsed.tolist() == colors
+
+    vb.import_from_blender(parsed[::-1])
+    vb.import_from_blender(colors)
+    assert write_bytes(ColorVertexBuffer.write, vb) == data
+
+
+def test_color_vb_disabled():
+    """Test ColorVertexBuffer without vertex colors."""
+    data = struct.pack('<HII', 1, 0, 3)
+    vb = ColorVertexBuffer.read(pyio.BytesIO(data))
+    assert vb.parse() is None
+    assert write_bytes(ColorVertexBuffer.write, vb) == data
+
+
+@pytest.mark.parametrize('colors, error', [
+    ([[0, 0, 0]], RuntimeError),
+    ([0, 0, 0, 0], RuntimeError),
+    ([[0, 0, 0, 256]], OverflowError),
+    ([[0.5, 0, 0, 1]], TypeError),
+])
+def test_color_vb_import_error(colors, error):
+    """Test ColorVertexBuffer.import_from_blender with invalid colors."""
+    vb = ColorVertexBuffer.read(pyio.BytesIO(color_vb_bytes([[0, 0, 0, 0]])))
+    with pytest.raises(error):
+        vb.import_from_blender(colors)
+
+
+@pytest.mark.parametrize('uv_num', [1, 3])
+@pytest.mark.parametrize('use_float32', [0, 1])
+def test_static_mesh_vb_round_trip(uv_num, use_float32):
+    """Test StaticMeshVertexBuffer with known bytes."""
+    vertex_num = 5
+    normals = make_normals(vertex_num)
+    texcoords = make_texcoords(uv_num, vertex_num)
+    stride = 8 + uv_num * 4 * (1 + use_float32)
+    data = b''.join([struct.pack('<HIIIII', 1, uv_num, stride, vertex_num, use_float32, 0),
+                     struct.pack('<II', stride, vertex_num)]
+                    + [bytes(normals[i]) + pack_texcoords(texcoords, i, use_float32) for i in range(vertex_num)])
+
+    vb = StaticMeshVertexBuffer.read(pyio.BytesIO(data))
+    normal, parsed_texcoords = vb.parse()
+    assert normal.tolist() == normals[:, 4:7].tolist()
+    assert parsed_texcoords.shape == (uv_num, vertex_num, 2)
+    assert np.array_equal(parsed_texcoords, texcoords)
+
+    vb.import_from_blender(normals, parsed_texcoords, uv_num)
+    assert write_bytes(StaticMeshVertexBuffer.write, vb) == data
+
+
+@pytest.mark.parametrize('uv_num', [1, 2])
+@pytest.mark.parametrize('use_float32', [0, 1])
+def test_skeletal_mesh_vb_round_trip(uv_num, use_float32):
+    """Test SkeletalMeshVertexBuffer with known bytes."""
+    vertex_num = 4
+    normals = make_normals(vertex_num)
+    positions = np.arange(vertex_num * 3).reshape(vertex_num, 3) * 1.5
+    texcoords = make_texcoords(uv_num, vertex_num)
+    stride = 20 + uv_num * 4 * (1 + use_float32)
+    data = b''.join([struct.pack('<HII', 1, uv_num, use_float32),
+                     struct.pack('<3f3I', 1.0, 1.0, 1.0, 0, 0, 0),
+                     struct.pack('<II', stride, vertex_num)]
+                    + [bytes(normals[i]) + struct.pack('<3f', *positions[i])
+                       + pack_texcoords(texcoords, i, use_float32) for i in range(vertex_num)])
+
+    vb = SkeletalMeshVertexBuffer.read(pyio.BytesIO(data))
+    normal, position, parsed_texcoords = vb.parse()
+    assert normal.tolist() == normals[:, 4:7].tolist()
+    assert position.tolist() == positions.tolist()
+    assert np.array_equal(parsed_texcoords, texcoords)
+
+    vb.import_from_blender(normals, position, parsed_texcoords, uv_num)
+    assert write_bytes(SkeletalMeshVertexBuffer.write, vb) == data
+
+
+def make_skin_weights(vertex_num, influence_count):
+    """Get joints and weights as (vertex_num, influence_count) arrays."""
+    joints = np.arange(vertex_num * influence_count).reshape(vertex_num, influence_count) % 256
+    weights = 255 - joints
+    return joints.astype(np.uint8), weights.astype(np.uint8)
+
+
+@pytest.mark.parametrize('extra_bone_flag', [0, 1])
+def test_skin_weight_vb4_round_trip(extra_bone_flag):
+    """Test SkinWeightVertexBuffer4 with known bytes."""
+    vertex_num = 3
+    influence_count = 4 * (1 + extra_bone_flag)
+    joints, weights = make_skin_weights(vertex_num, influence_count)
+    data = b''.join([struct.pack('<HII', 1, extra_bone_flag, vertex_num),
+                     struct.pack('<II', influence_count * 2, vertex_num)]
+                    + [bytes(joints[i]) + bytes(weights[i]) for i in range(vertex_num)])
+
+    vb = SkinWeightVertexBuffer4.read(pyio.BytesIO(data))
+    joint, weight = vb.parse()
+    assert joint.tolist() == joints.tolist()
+    assert weight.tolist() == weights.tolist()
+
+    vb.import_from_blender(joint, weight, extra_bone_flag)
+    assert write_bytes(SkinWeightVertexBuffer4.write, vb) == data
+
+
+@pytest.mark.parametrize('influence_count', [4, 8, 12])
+def test_skin_weight_vb5_round_trip(influence_count):
+    """Test SkinWeightVertexBuffer5 with known bytes."""
+    vertex_num = 3
+    joints, weights = make_skin_weights(vertex_num, influence_count)
+    influence_x_vertex = influence_count * vertex_num
+    data = b''.join([struct.pack('<HIIIII', 1, 0, influence_count, influence_x_vertex, vertex_num, 0),
+                     struct.pack('<II', 1, influence_x_vertex * 2)]
+                    + [bytes(joints[i]) + bytes(weights[i]) for i in range(vertex_num)])
+
+    vb = SkinWeightVertexBuffer5.read(pyio.BytesIO(data))
+    joint, weight = vb.parse()
+    assert joint.tolist() == joints.tolist()
+    assert weight.tolist() == weights.tolist()
+
+    vb.import_from_blender(joint, weight)
+    assert write_bytes(SkinWeightVertexBuffer5.write, vb) == data
+
+
+@pytest.mark.parametrize('version', ['4.18', 'ff7r', 'kh3', '4.27', '5.0', '5.1'])
+@pytest.mark.parametrize('use_uint32', [0, 1])
+def test_static_ib_round_trip(version, use_uint32):
+    """Test StaticIndexBuffer with known bytes."""
+    version = make_version(version)
+    ids = [0, 1, 2, 2, 1, 3]
+    if use_uint32:
+        ids += [65536, 65537, 70000]
+    stride = 2 + 2 * use_uint32
+    data = b''.join([struct.pack('<III', use_uint32, 1, len(ids) * stride),
+                     struct.pack(f'<{len(ids)}' + ('I' if use_uint32 else 'H'), *ids),
+                     bytes(4) if version >= '4.27' else b''])
+
+    f = pyio.BytesIO(data)
+    ib = StaticIndexBuffer.read(f, version)
+    assert f.tell() == len(data)
+    indices = ib.parse()
+    assert indices.tolist() == ids
+
+    ib.update(indices, use_uint32=bool(use_uint32))
+    assert write_bytes(StaticIndexBuffer.write, ib) == data
+
+
+@pytest.mark.parametrize('stride', [2, 4])
+def test_skeletal_ib_round_trip(stride):
+    """Test SkeletalIndexBuffer with known bytes."""
+    ids = [0, 1, 2, 2, 1, 3]
+    data = struct.pack('<BII', stride, stride, len(ids)) + struct.pack(f'<{len(ids)}' + 'HI'[stride // 4], *ids)
+
+    ib = SkeletalIndexBuffer.read(pyio.BytesIO(data))
+    indices = ib.parse()
+    assert indices.tolist() == ids
+
+    ib.update(indices, stride)
+    assert write_bytes(SkeletalIndexBuffer.write, ib) == data
+
+
+@pytest.mark.parametrize('version', ['4.18', 'ff7r', 'kh3', '4.27', '5.0', '5.1'])
+def test_static_lod_section_round_trip(version):
+    """Test StaticLODSection with known bytes."""
+    version = make_version(version)
+    # material_id, first_ib_id, face_num, first_vertex_id, last_vertex_id, enable_collision, cast_shadow
+    fields_list = [(0, 0, 4, 0, 5, 1, 1), (1, 12, 2, 6, 9, 0, 1)]
+    if version >= '4.27':
+        fields_list = [fields + (i, 1 - i) for i, fields in enumerate(fields_list)]
+    fmt = f'<{len(fields_list[0])}I'
+    data = struct.pack('<I', len(fields_list)) + b''.join([struct.pack(fmt, *fields) for fields in fields_list])
+
+    f = pyio.BytesIO(data)
+    sections = StaticLODSection.read_array(f, version)
+    assert f.tell() == len(data)
+    f.seek(4)
+    assert vars(StaticLODSection.read(f, version)) == vars(sections[0])
+
+    for section, fields in zip(sections, fields_list):
+        material_id, first_ib_id, face_num, first_vertex_id, last_vertex_id = fields[:5]
+        section.import_from_blender(material_id, first_vertex_id, last_vertex_id - first_vertex_id + 1,
+                                    first_ib_id, face_num)
+    written = b''.join([write_bytes(StaticLODSection.write, section) for section in sections])
+    assert struct.pack('<I', len(sections)) + written == data
+
+
+SECTION_VERTEX_GROUP = [0, 3, 4, 300]
+
+
+def skeletal_section4_bytes(kdi_num):
+    """Get binary data of SkeletalLODSection4.
+
+    Notes:
+        kdi_num should be None for versions without KDI data.
+    """
+    vertex_group = SECTION_VERTEX_GROUP
+    data = [struct.pack('<HHIII3s1sIII', 1, 2, 30, 10, 0, b'\x00\xff\xff', b'\x05', 1, 0, 8),
+            struct.pack(f'<I{len(vertex_group)}H', len(vertex_group), *vertex_group),
+            struct.pack('<II12s2s16si', 6, 4, bytes(12), b'\xcd\xcd', bytes(16), -1)]
+    if kdi_num is not None:
+        data.append(struct.pack('<II', kdi_num > 0, kdi_num) + bytes(range(16 * kdi_num)))
+    return b''.join(data)
+
+
+@pytest.mark.parametrize('version, kdi_num', [
+    ('4.18', None),
+    ('4.26', None),
+    ('ff7r', 0),
+    ('ff7r', 2),
+    ('kh3', 0),
+    ('kh3', 1),
+])
+def test_skeletal_lod_section4_round_trip(version, kdi_num):
+    """Test SkeletalLODSection4 with known bytes."""
+    version = make_version(version)
+    data = skeletal_section4_bytes(kdi_num)
+
+    f = pyio.BytesIO(data)
+    section = SkeletalLODSection4.read(f, version)
+    assert f.tell() == len(data)
+    assert section.vertex_group.tolist() == SECTION_VERTEX_GROUP
+
+    section.import_from_blender(list(SECTION_VERTEX_GROUP), 2, 8, 6, 30, 10, 4)
+    assert write_bytes(SkeletalLODSection4.write, section) == data
+
+    if kdi_num is not None:
+        section.remove_KDI()
+        assert write_bytes(SkeletalLODSection4.write, section) == skeletal_section4_bytes(0)
+
+
+@pytest.mark.parametrize('version', ['4.27', '5.0', '5.1'])
+def test_skeletal_lod_section5_round_trip(version):
+    """Test SkeletalLODSection5 with known bytes."""
+    version = make_version(version)
+    vertex_group = SECTION_VERTEX_GROUP
+    unk_ids = [1, 70000]
+    vertex_num = 3
+    if version >= '5.0':
+        head = struct.pack('<HHIQBIIQ', 1, 2, 30, 10, 5, 1, 1, 8)
+    else:
+        head = struct.pack('<HHIQBIQ', 1, 2, 30, 10, 5, 1, 8)
+    data = b''.join([head,
+                     struct.pack(f'<I{len(vertex_group)}H', len(vertex_group), *vertex_group),
+                     struct.pack('<II2s16si', vertex_num, 4, b'\xff\xff', bytes(16), -1),
+                     struct.pack(f'<I{len(unk_ids)}I', len(unk_ids), *unk_ids),
+                     struct.pack('<I', vertex_num), bytes(range(vertex_num * 8)),
+                     bytes(4)])
+
+    f = pyio.BytesIO(data)
+    section = SkeletalLODSection5.read(f, version)
+    assert f.tell() == len(data)
+    assert section.vertex_group.tolist() == vertex_group
+    assert section.unk_ids.tolist() == unk_ids
+    assert (section.ray_tracing is None) == (version < '5.0')
+
+    section.import_from_blender(list(vertex_group), 2, 8, vertex_num, 30, 10, 4)
+    assert write_bytes(SkeletalLODSection5.write, section) == data
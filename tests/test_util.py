@@ -1,7 +1,11 @@
 """Tests for util/*.py."""
+import io as pyio
+
+import numpy as np
 import pytest
 from blender_uasset_addon.util.version import VersionInfo
 from blender_uasset_addon.util import cipher
+from blender_uasset_addon.util import io_util as io
 
 
 def test_versioninfo_op():
@@ -50,3 +54,99 @@ def test_cipher(string):
     encrypted = cipher.encrypt(string)
     decrypted = cipher.decrypt(encrypted)
     assert string == decrypted
+
+
+def test_mapped_file(tmp_path):
+    """Test io_util.MappedFile."""
+    file = str(tmp_path / 'test.uexp')
+    with open(file, 'wb') as f:
+        f.write(b'0123456789')
+    with io.MappedFile(file) as f:
+        assert f.name == file
+        f.seek(2)
+        assert f.read(4) == b'2345'
+        assert io.peek_uint8(f) == ord('6')
+        buf = bytearray(2)
+        assert f.readinto(buf) == 2
+        assert buf == b'67'
+        assert io.get_size(f) == 10
+        assert f.tell() == 8
+        assert f.read() == b'89'
+    assert f.closed
+    # the file can be overwritten after closing
+    with open(file, 'wb') as f:
+        f.write(b'0')
+
+
+@pytest.mark.parametrize('ary', [[1, 2, 65535], np.array([1, 2, 65535]), np.array([1, 2, 65535], dtype='<u2')])
+def test_write_uint16_array(ary):
+    """Test io_util.write_uint16_array with lists and ndarrays."""
+    f = pyio.BytesIO()
+    io.write_uint16_array(f, ary, with_length=True)
+    assert f.getvalue() == b'\x03\x00\x00\x00\x01\x00\x02\x00\xff\xff'
+
+
+@pytest.mark.parametrize('ary', [[70000, -1], np.array([70000, -1]), np.array([-1], dtype=np.int8)])
+def test_write_uint16_array_overflow(ary):
+    """Test io_util.write_uint16_array with out-of-range values."""
+    with pytest.raises(OverflowError):
+        io.write_uint16_array(pyio.BytesIO(), ary)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 5, 0x10000])
+@pytest.mark.parametrize('data, pattern, start, expected', [
+    (b'\x00\x01\xff\xff\xff\x02', b'\xff\xff\xff', 0, 2),
+    (b'\xff\xff\x00\xff\xff\xff', b'\xff\xff\xff', 0, 3),
+    (b'\xff\xff\xff\xff', b'\xff\xff\xff', 1, 1),
+    (b'\x01\x00\x01\x00\x00\x01\x00\x01\x00\x00\x00', b'\x01\x00\x01\x00\x00\x00', 0, 5),
+    (b'\xff\xff\x00\xff\xff', b'\xff\xff\xff', 0, -1),
+    (b'\xff\xff\xff', b'\xff\xff\xff', 1, -1),
+    (b'', b'\xff', 0, -1),
+])
+def test_find_bytes(data, pattern, start, expected, chunk_size):
+    """Test io_util.find_bytes with patterns split between chunks."""
+    f = pyio.BytesIO(data)
+    f.seek(start)
+    assert io.find_bytes(f, pattern, chunk_size=chunk_size) == expected
+    assert f.tell() == start
+
+
+class NoPeekStream(pyio.RawIOBase):
+    """Readable stream without peek()."""
+    def __init__(self, data):
+        """Constructor."""
+        self.stream = pyio.BytesIO(data)
+
+    def readable(self):
+        """Return True."""
+        return True
+
+    def seekable(self):
+        """Return True."""
+        return True
+
+    def readinto(self, b):
+        """Read function."""
+        return self.stream.readinto(b)
+
+    def seek(self, offset, whence=0):
+        """Seek function."""
+        return self.stream.seek(offset, whence)
+
+    def tell(self):
+        """Tell function."""
+        return self.stream.tell()
+
+
+@pytest.mark.parametrize('make_stream', [
+    pyio.BytesIO,
+    lambda data: pyio.BufferedReader(pyio.BytesIO(data)),
+    NoPeekStream,
+])
+def test_peek_uint8(make_stream):
+    """Test io_util.peek_uint8 with BytesIO, buffered streams, and streams without peek()."""
+    f = make_stream(b'\x03\x07')
+    f.read(1)
+    assert io.peek_uint8(f) == 7
+    assert f.tell() == 1
+    assert io.read_uint8(f) == 7